@@ -16,6 +16,7 @@ from homeassistant.exceptions import (
 )
 from homeassistant.helpers.aiohttp_client import async_get_clientsession
 
+from .client import PhynClient
 from .const import CLIENT, DOMAIN, CONF_HOME_ID, CONF_DEVICE_IDS
 from .update_coordinator import PhynDataUpdateCoordinator
 from .exceptions import HaAuthError, HaCannotConnect
@@ -117,11 +118,11 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     hass.data[DOMAIN] = {}
     client_id = f"homeassistant-{hass.data['core.uuid']}-{entry.entry_id}"
     try:
-        hass.data[DOMAIN][CLIENT] = client = await async_get_api(
+        hass.data[DOMAIN][CLIENT] = client = PhynClient(await async_get_api(
             entry.data[CONF_USERNAME], entry.data[CONF_PASSWORD],
             phyn_brand="phyn", session=session,
             client_id=client_id
-        )
+        ))
     except AuthenticationError as error:
         raise ConfigEntryAuthFailed(
             translation_domain=DOMAIN,
@@ -173,9 +174,9 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
             _LOGGER.debug("Removed stale device %s", phyn_ids)
 
     try:
-        await client.mqtt.connect()
-
         coordinator = PhynDataUpdateCoordinator(hass, client, entry)
+        # Load before adding devices so each starts from its cached data.
+        await coordinator.async_load_storage()
         for device_id in device_ids:
             if device_id in all_account_devices:
                 info = all_account_devices[device_id]
@@ -187,12 +188,15 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
                 )
         hass.data[DOMAIN]["coordinator"] = coordinator
 
-        await coordinator.async_refresh()
-        await coordinator.async_setup()
-
+        # Entities start from the warm-start cache, so the platforms are set up
+        # as soon as the devices are known; MQTT and the first refresh follow
+        # in the background.
         await hass.config_entries.async_forward_entry_setups(entry, PLATFORMS)
         await phyn_leak_test_service_setup(hass)
 
+        entry.async_create_background_task(
+            hass, coordinator.async_start(), f"{DOMAIN} startup"
+        )
         return True
     except Exception:
         # Ensure MQTT is disconnected on any setup failure to avoid leaking
@@ -217,6 +221,8 @@ async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
         )
     unload_ok = await hass.config_entries.async_unload_platforms(entry, PLATFORMS)
     if unload_ok:
+        await hass.data[DOMAIN]["coordinator"].async_shutdown()
+        await hass.data[DOMAIN]["coordinator"].async_save_storage()
         del hass.data[DOMAIN][CLIENT]
         del hass.data[DOMAIN]["coordinator"]
     return unload_ok
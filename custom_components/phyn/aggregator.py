@@ -0,0 +1,58 @@
+"""Streaming hourly aggregation of sensor readings for long-term statistics."""
+from __future__ import annotations
+
+from homeassistant.components.recorder.statistics import StatisticData
+from homeassistant.util import dt as dt_util
+
+HOUR = 3600
+
+
+class HourlyAggregator:
+    """Running mean, min and max per hour, fed one reading at a time.
+
+    Readings are folded into per-hour accumulators as they arrive, so no list
+    of readings is ever materialized.  Hours starting before *since*, or at
+    or after *until*, are dropped; pass an import watermark to only aggregate
+    new or changed hours.  Safe to use off the event loop.
+    """
+
+    __slots__ = ("_buckets", "_since", "_until")
+
+    def __init__(self, since: float = 0, until: float | None = None) -> None:
+        """Initialize the aggregator."""
+        # hour start -> [count, total, min, max]
+        self._buckets: dict[int, list[float]] = {}
+        self._since = since
+        self._until = until
+
+    def __len__(self) -> int:
+        """Return the number of hours with readings."""
+        return len(self._buckets)
+
+    def add(self, ts: float, value: float) -> None:
+        """Fold a reading taken at *ts* (epoch seconds) into its hour."""
+        hour = int(ts // HOUR * HOUR)
+        if hour < self._since or (self._until is not None and hour >= self._until):
+            return
+        bucket = self._buckets.get(hour)
+        if bucket is None:
+            self._buckets[hour] = [1, value, value, value]
+            return
+        bucket[0] += 1
+        bucket[1] += value
+        if value < bucket[2]:
+            bucket[2] = value
+        elif value > bucket[3]:
+            bucket[3] = value
+
+    def statistics(self) -> list[StatisticData]:
+        """Return one statistics row per hour, oldest first."""
+        return [
+            StatisticData(
+                start=dt_util.utc_from_timestamp(hour),
+                mean=total / count,
+                min=low,
+                max=high,
+            )
+            for hour, (count, total, low, high) in sorted(self._buckets.items())
+        ]
@@ -0,0 +1,89 @@
+"""Persistent store of Phyn alert IDs that have already been dispatched."""
+from __future__ import annotations
+
+import time
+from typing import Any
+
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers.storage import Store
+
+from .const import DOMAIN
+
+STORAGE_VERSION = 1
+SAVE_DELAY = 30
+
+# An ID is forgotten once the API has not returned it for this long.  IDs the
+# API keeps returning are re-touched every poll, so they never expire while
+# they could still be mistaken for new alerts.
+SEEN_ALERT_RETENTION = 30 * 24 * 3600
+SEEN_ALERT_MAX_IDS = 5000
+
+
+class PhynSeenAlertStore:
+    """Bounded, time-windowed set of seen alert IDs persisted in HA storage.
+
+    IDs are kept in least-recently-observed order, so pruning by age or by
+    size only ever looks at the oldest entries.
+    """
+
+    def __init__(self, hass: HomeAssistant, entry_id: str) -> None:
+        """Initialize the store."""
+        self._store: Store[dict[str, Any]] = Store(
+            hass, STORAGE_VERSION, f"{DOMAIN}.{entry_id}.seen_alerts"
+        )
+        self._seen: dict[str, float] = {}
+        self._seeded_devices: set[str] = set()
+
+    async def async_load(self) -> None:
+        """Load previously seen alert IDs from storage."""
+        data = await self._store.async_load()
+        if not data:
+            return
+        self._seen = dict(sorted(data.get("alerts", {}).items(), key=lambda item: item[1]))
+        self._seeded_devices = set(data.get("seeded_devices", []))
+
+    async def async_save(self) -> None:
+        """Write the store to disk immediately."""
+        await self._store.async_save(self._data_to_save())
+
+    @callback
+    def _data_to_save(self) -> dict[str, Any]:
+        """Return the data to persist."""
+        return {
+            "alerts": self._seen,
+            "seeded_devices": sorted(self._seeded_devices),
+        }
+
+    def device_seeded(self, device_id: str) -> bool:
+        """Return True if the device's existing alerts have been recorded."""
+        return device_id in self._seeded_devices
+
+    @callback
+    def mark_device_seeded(self, device_id: str) -> None:
+        """Record that the device's existing alerts have been recorded."""
+        self._seeded_devices.add(device_id)
+        self._store.async_delay_save(self._data_to_save, SAVE_DELAY)
+
+    @callback
+    def touch(self, alert_id: str) -> bool:
+        """Mark an alert ID as observed now; return True if it was not seen before."""
+        is_new = self._seen.pop(alert_id, None) is None
+        self._seen[alert_id] = time.time()
+        if is_new:
+            self._store.async_delay_save(self._data_to_save, SAVE_DELAY)
+        return is_new
+
+    @callback
+    def async_prune(self) -> None:
+        """Drop IDs not observed within the retention window and cap the size."""
+        cutoff = time.time() - SEEN_ALERT_RETENTION
+        overflow = len(self._seen) - SEEN_ALERT_MAX_IDS
+        expired: list[str] = []
+        for alert_id, observed_at in self._seen.items():
+            if observed_at >= cutoff and len(expired) >= overflow:
+                break
+            expired.append(alert_id)
+        for alert_id in expired:
+            del self._seen[alert_id]
+        if expired:
+            self._store.async_delay_save(self._data_to_save, SAVE_DELAY)
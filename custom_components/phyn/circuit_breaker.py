@@ -0,0 +1,58 @@
+"""Circuit breaker for Phyn endpoints that keep failing."""
+from __future__ import annotations
+
+import random
+import time
+
+# Consecutive failures before the breaker opens, and the backoff range it
+# waits before letting a single probe request through.
+BREAKER_FAILURE_THRESHOLD = 2
+BREAKER_BASE_BACKOFF = 60
+BREAKER_MAX_BACKOFF = 3600
+# Backoffs are spread by up to this fraction either way, so devices that
+# failed together do not all probe in the same cycle.
+BREAKER_JITTER = 0.2
+
+
+def jittered(delay: float) -> float:
+    """Return *delay* randomly spread by BREAKER_JITTER."""
+    return delay * random.uniform(1 - BREAKER_JITTER, 1 + BREAKER_JITTER)
+
+
+class PhynCircuitBreaker:
+    """Closed, open or half-open state of one endpoint.
+
+    After BREAKER_FAILURE_THRESHOLD consecutive failures the breaker opens
+    and requests are skipped for a jittered, exponentially growing backoff.
+    Once it expires the breaker is half-open: the next request is a probe
+    that closes it on success or reopens it, for longer, on failure.
+    """
+
+    __slots__ = ("failures", "open_until")
+
+    def __init__(self) -> None:
+        """Initialize a closed breaker."""
+        self.failures = 0
+        self.open_until = 0.0
+
+    @property
+    def is_open(self) -> bool:
+        """Return True while requests should be skipped."""
+        return time.monotonic() < self.open_until
+
+    def record_success(self) -> None:
+        """Close the breaker."""
+        self.failures = 0
+        self.open_until = 0.0
+
+    def record_failure(self) -> float | None:
+        """Count a failure; return the backoff in seconds if the breaker opened."""
+        self.failures += 1
+        if self.failures < BREAKER_FAILURE_THRESHOLD:
+            return None
+        backoff = jittered(min(
+            BREAKER_BASE_BACKOFF * 2 ** (self.failures - BREAKER_FAILURE_THRESHOLD),
+            BREAKER_MAX_BACKOFF,
+        ))
+        self.open_until = time.monotonic() + backoff
+        return backoff
@@ -0,0 +1,194 @@
+"""Request-deduplicating wrapper around the aiophyn API client."""
+from __future__ import annotations
+
+import asyncio
+from collections.abc import Awaitable, Callable
+import time
+from typing import Any
+
+from aiophyn.api import API
+
+from .const import LOGGER
+from .rate_limiter import PhynRateLimiter, RequestPriority
+
+# Seconds a response is reused by identical calls, per "namespace.method".
+# Reads not listed here are only merged while in flight.  Every entry is
+# dropped as soon as a write is sent to the same device.
+RESPONSE_CACHE_TTL: dict[str, float] = {
+    "alert.get_active_summary": 5,
+    "alert.get_latest": 5,
+    "device.get_state": 5,
+    "device.get_autoshuftoff_status": 30,
+    "device.get_away_mode": 30,
+    "device.get_consumption": 30,
+    "device.get_device_preferences": 30,
+    "device.get_health_tests": 10,
+}
+
+# Rate-limiter lane of each read, per "namespace.method".  Unlisted reads use
+# the STATE lane and every write uses the SAFETY lane.
+REQUEST_PRIORITY: dict[str, RequestPriority] = {
+    "alert.get_active_summary": RequestPriority.ALERTS,
+    "alert.get_latest": RequestPriority.ALERTS,
+    "device.get_latest_firmware_info": RequestPriority.BULK,
+    "device.get_water_statistics": RequestPriority.BULK,
+}
+
+# Namespaces whose calls go through the wrapper; anything else (mqtt, home,
+# username, ...) is the aiophyn object itself.
+WRAPPED_NAMESPACES = ("alert", "device")
+
+_RequestKey = tuple[str, tuple[Any, ...], tuple[tuple[str, Any], ...]]
+
+
+def _freeze(value: Any) -> Any:
+    """Return a hashable equivalent of a request argument."""
+    if isinstance(value, (list, tuple, set, frozenset)):
+        return tuple(_freeze(item) for item in value)
+    if isinstance(value, dict):
+        return tuple(sorted((key, _freeze(item)) for key, item in value.items()))
+    return value
+
+
+class PhynClient:
+    """aiophyn API client that merges identical reads and paces requests.
+
+    ``get_*`` calls with the same endpoint and arguments share one in-flight
+    request, and the response is reused for the endpoint's
+    RESPONSE_CACHE_TTL.  Any other call is a write: it goes straight through
+    and then expires the cached and in-flight reads of the device it targets
+    (its first argument).  Responses are shared between callers and must
+    not be mutated; async_read_timed tells how old a shared response is.
+
+    Every request that reaches the cloud first takes a token from the
+    account's rate limiter in its REQUEST_PRIORITY lane.
+    """
+
+    def __init__(self, api: API) -> None:
+        """Initialize the wrapper."""
+        self._api = api
+        self.rate_limiter = PhynRateLimiter()
+        self._responses: dict[_RequestKey, tuple[float, tuple[float, Any]]] = {}
+        self._inflight: dict[_RequestKey, asyncio.Task[tuple[float, Any]]] = {}
+        for namespace in WRAPPED_NAMESPACES:
+            setattr(self, namespace, _PhynApiNamespace(self, namespace, getattr(api, namespace)))
+
+    def __getattr__(self, name: str) -> Any:
+        """Pass through everything that is not wrapped."""
+        return getattr(self._api, name)
+
+    async def async_read(
+        self, endpoint: str, method: Callable[..., Awaitable[Any]], *args: Any, **kwargs: Any
+    ) -> Any:
+        """Call a read endpoint, sharing identical requests and recent responses."""
+        return (await self._async_read_timed(endpoint, method, *args, **kwargs))[1]
+
+    async def async_read_timed(self, endpoint: str, *args: Any, **kwargs: Any) -> tuple[float, Any]:
+        """Call a read endpoint by name, also returning when its request was sent.
+
+        The response may come from a shared or cached request, so callers
+        that merge it with fresher data must date it by the returned send
+        time (epoch seconds) rather than by the time of their own call.
+        """
+        namespace, name = endpoint.split(".")
+        method = getattr(getattr(self._api, namespace), name)
+        return await self._async_read_timed(endpoint, method, *args, **kwargs)
+
+    async def _async_read_timed(
+        self, endpoint: str, method: Callable[..., Awaitable[Any]], *args: Any, **kwargs: Any
+    ) -> tuple[float, Any]:
+        """Return the send time and response of a shared or cached read."""
+        key: _RequestKey = (endpoint, _freeze(args), _freeze(kwargs))
+        cached = self._responses.get(key)
+        if cached is not None:
+            if time.monotonic() < cached[0]:
+                return cached[1]
+            del self._responses[key]
+
+        task = self._inflight.get(key)
+        if task is None:
+            priority = REQUEST_PRIORITY.get(endpoint, RequestPriority.STATE)
+            task = asyncio.ensure_future(self._async_send_read(priority, method, *args, **kwargs))
+            self._inflight[key] = task
+            task.add_done_callback(lambda done: self._read_done(key, done))
+        # Shielded so that one caller timing out does not cancel the request
+        # the other callers are waiting on.
+        return await asyncio.shield(task)
+
+    def _read_done(self, key: _RequestKey, task: asyncio.Task[tuple[float, Any]]) -> None:
+        """Cache a finished read unless a write has superseded it."""
+        if self._inflight.get(key) is not task:
+            # Expired by a write while in flight; the response may be stale.
+            if not task.cancelled():
+                task.exception()
+            return
+        del self._inflight[key]
+        if task.cancelled() or task.exception() is not None:
+            return
+        ttl = RESPONSE_CACHE_TTL.get(key[0], 0)
+        if ttl > 0:
+            self._responses[key] = (time.monotonic() + ttl, task.result())
+
+    async def async_write(
+        self, endpoint: str, method: Callable[..., Awaitable[Any]], *args: Any, **kwargs: Any
+    ) -> Any:
+        """Call a write endpoint, then expire the target device's reads."""
+        try:
+            return await self._async_send(RequestPriority.SAFETY, method, *args, **kwargs)
+        finally:
+            if args:
+                self.invalidate(args[0])
+            LOGGER.debug("Expired cached reads after %s%s", endpoint, args[:1])
+
+    async def _async_send(
+        self,
+        priority: RequestPriority,
+        method: Callable[..., Awaitable[Any]],
+        *args: Any,
+        **kwargs: Any,
+    ) -> Any:
+        """Wait for a rate-limiter token, then send the request."""
+        await self.rate_limiter.acquire(priority)
+        return await method(*args, **kwargs)
+
+    async def _async_send_read(
+        self,
+        priority: RequestPriority,
+        method: Callable[..., Awaitable[Any]],
+        *args: Any,
+        **kwargs: Any,
+    ) -> tuple[float, Any]:
+        """Send a read like _async_send, returning its send time with the response."""
+        await self.rate_limiter.acquire(priority)
+        sent_at = time.time()
+        return sent_at, await method(*args, **kwargs)
+
+    def invalidate(self, device_id: Any) -> None:
+        """Drop cached and in-flight reads whose first argument is *device_id*."""
+        for store in (self._responses, self._inflight):
+            for key in [key for key in store if key[1][:1] == (device_id,)]:
+                del store[key]
+
+
+class _PhynApiNamespace:
+    """One wrapped aiophyn namespace, such as ``client.device``."""
+
+    def __init__(self, client: PhynClient, name: str, target: Any) -> None:
+        """Initialize the namespace."""
+        self._client = client
+        self._name = name
+        self._target = target
+
+    def __getattr__(self, attr: str) -> Any:
+        """Return the wrapped method, cached on the instance after first use."""
+        method = getattr(self._target, attr)
+        if not callable(method):
+            return method
+        endpoint = f"{self._name}.{attr}"
+        call = self._client.async_read if attr.startswith("get_") else self._client.async_write
+
+        async def _call(*args: Any, **kwargs: Any) -> Any:
+            return await call(endpoint, method, *args, **kwargs)
+
+        setattr(self, attr, _call)
+        return _call
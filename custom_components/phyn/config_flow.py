@@ -15,6 +15,15 @@ from .const import (
     ALL_ALERT_TYPES,
     CONF_EXCLUDED_ALERT_TYPES,
     CONF_DEVICE_IDS,
+    CONF_MAX_CONCURRENT_UPDATES,
+    DEFAULT_MAX_CONCURRENT_UPDATES,
+    MAX_CONCURRENT_UPDATES_LIMIT,
+    CONF_PUSH_COALESCE_SECONDS,
+    DEFAULT_PUSH_COALESCE_SECONDS,
+    MAX_PUSH_COALESCE_SECONDS,
+    CONF_STATISTICS_BACKFILL_HOURS,
+    DEFAULT_STATISTICS_BACKFILL_HOURS,
+    MAX_STATISTICS_BACKFILL_HOURS,
 )
 
 DATA_SCHEMA = vol.Schema({
@@ -243,7 +252,7 @@ class CannotConnect(exceptions.HomeAssistantError):
 
 
 class PhynOptionsFlow(config_entries.OptionsFlow):
-    """Handle Phyn integration options (e.g. suppressed alert types)."""
+    """Handle Phyn integration options (suppressed alert types, polling)."""
 
     def __init__(self, config_entry: config_entries.ConfigEntry) -> None:
         """Initialize options flow."""
@@ -255,6 +264,15 @@ class PhynOptionsFlow(config_entries.OptionsFlow):
             return self.async_create_entry(title="", data=user_input)
 
         current_excluded = self._config_entry.options.get(CONF_EXCLUDED_ALERT_TYPES, [])
+        current_concurrency = self._config_entry.options.get(
+            CONF_MAX_CONCURRENT_UPDATES, DEFAULT_MAX_CONCURRENT_UPDATES
+        )
+        current_coalesce = self._config_entry.options.get(
+            CONF_PUSH_COALESCE_SECONDS, DEFAULT_PUSH_COALESCE_SECONDS
+        )
+        current_backfill = self._config_entry.options.get(
+            CONF_STATISTICS_BACKFILL_HOURS, DEFAULT_STATISTICS_BACKFILL_HOURS
+        )
 
         schema = vol.Schema(
             {
@@ -262,6 +280,27 @@ class PhynOptionsFlow(config_entries.OptionsFlow):
                     CONF_EXCLUDED_ALERT_TYPES,
                     default=current_excluded,
                 ): cv.multi_select(ALL_ALERT_TYPES),
+                vol.Optional(
+                    CONF_MAX_CONCURRENT_UPDATES,
+                    default=current_concurrency,
+                ): vol.All(
+                    vol.Coerce(int),
+                    vol.Range(min=1, max=MAX_CONCURRENT_UPDATES_LIMIT),
+                ),
+                vol.Optional(
+                    CONF_PUSH_COALESCE_SECONDS,
+                    default=current_coalesce,
+                ): vol.All(
+                    vol.Coerce(float),
+                    vol.Range(min=0, max=MAX_PUSH_COALESCE_SECONDS),
+                ),
+                vol.Optional(
+                    CONF_STATISTICS_BACKFILL_HOURS,
+                    default=current_backfill,
+                ): vol.All(
+                    vol.Coerce(int),
+                    vol.Range(min=0, max=MAX_STATISTICS_BACKFILL_HOURS),
+                ),
             }
         )
         return self.async_show_form(step_id="init", data_schema=schema)
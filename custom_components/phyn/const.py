@@ -28,3 +28,23 @@ ALL_ALERT_TYPES: dict[str, str] = {
 CONF_EXCLUDED_ALERT_TYPES = "excluded_alert_types"
 CONF_HOME_ID = "home_id"
 CONF_DEVICE_IDS = "device_ids"
+CONF_MAX_CONCURRENT_UPDATES = "max_concurrent_updates"
+
+# Number of devices polled at the same time within one coordinator cycle.
+# A value of 1 restores strictly sequential polling.
+DEFAULT_MAX_CONCURRENT_UPDATES = 4
+MAX_CONCURRENT_UPDATES_LIMIT = 20
+
+CONF_PUSH_COALESCE_SECONDS = "push_coalesce_seconds"
+
+# Window (seconds) over which bursts of MQTT pushes are merged into a single
+# state write per entity.  0 writes on every push.
+DEFAULT_PUSH_COALESCE_SECONDS = 0.0
+MAX_PUSH_COALESCE_SECONDS = 30.0
+
+CONF_STATISTICS_BACKFILL_HOURS = "statistics_backfill_hours"
+
+# How many hours of PW1 history are imported into long-term statistics.  The
+# backfill is fetched in chunks over several polls, so deep values are safe.
+DEFAULT_STATISTICS_BACKFILL_HOURS = 72
+MAX_STATISTICS_BACKFILL_HOURS = 720
@@ -0,0 +1,71 @@
+"""Persistent cache of last-known Phyn device data for warm starts."""
+from __future__ import annotations
+
+from collections.abc import Callable
+from typing import Any
+
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers.storage import Store
+
+from .const import DOMAIN
+
+STORAGE_VERSION = 1
+SAVE_DELAY = 60
+
+
+class PhynDeviceCache:
+    """Last-known state, preferences, firmware and usage per device.
+
+    The cache lets entities start with their previous values after a restart
+    instead of sitting unknown until the first full poll completes.  Restored
+    data never marks an endpoint fresh, so the first poll still refreshes
+    everything.
+    """
+
+    def __init__(self, hass: HomeAssistant, entry_id: str) -> None:
+        """Initialize the cache."""
+        self._store: Store[dict[str, Any]] = Store(
+            hass, STORAGE_VERSION, f"{DOMAIN}.{entry_id}.device_cache"
+        )
+        self._devices: dict[str, dict[str, Any]] = {}
+        self._collect: Callable[[], dict[str, dict[str, Any]]] | None = None
+        self._save_pending = False
+
+    async def async_load(self) -> None:
+        """Load the cached device data from storage."""
+        data = await self._store.async_load()
+        if data:
+            self._devices = data.get("devices", {})
+
+    def get(self, device_id: str) -> dict[str, Any] | None:
+        """Return the cached data for a device, if any."""
+        return self._devices.get(device_id)
+
+    @callback
+    def async_schedule_save(
+        self, collect: Callable[[], dict[str, dict[str, Any]]]
+    ) -> None:
+        """Schedule a write of the data returned by *collect*.
+
+        *collect* maps device IDs to their cache data and is only called when
+        the delayed write actually happens, so scheduling is cheap.  A write
+        that is already pending is not pushed back, otherwise polling more
+        often than SAVE_DELAY would postpone it until shutdown.
+        """
+        self._collect = collect
+        if self._save_pending:
+            return
+        self._save_pending = True
+        self._store.async_delay_save(self._data_to_save, SAVE_DELAY)
+
+    async def async_save(self) -> None:
+        """Write the cache to disk immediately."""
+        await self._store.async_save(self._data_to_save())
+
+    @callback
+    def _data_to_save(self) -> dict[str, Any]:
+        """Return the data to persist."""
+        self._save_pending = False
+        if self._collect is not None:
+            self._devices = self._collect()
+        return {"devices": self._devices}
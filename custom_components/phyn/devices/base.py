@@ -1,15 +1,80 @@
 """ Generic Phyn Device"""
 from __future__ import annotations
 
-from typing import TYPE_CHECKING, Any, Callable
-import math
+from collections.abc import Mapping
+from functools import partial
+from types import MappingProxyType
+from typing import TYPE_CHECKING, Any, Awaitable, Callable
+import asyncio
 import time
 
+from aiophyn.errors import AuthenticationError
+
+from homeassistant.core import callback
+
+from ..circuit_breaker import PhynCircuitBreaker
 from ..const import LOGGER
+from .state import PhynDeviceState
 
 if TYPE_CHECKING:
+    from ..entities.base import PhynEntity
     from ..update_coordinator import PhynDataUpdateCoordinator
 
+#: Immutable per-cycle view of a device: entity type -> entity state values.
+PhynDeviceSnapshot = Mapping[str, tuple[Any, ...]]
+
+# Seconds of tolerance when comparing an endpoint's age against its TTL, so a
+# poll that fires marginally early does not skip a whole cycle.
+POLL_SCHEDULE_SLACK = 5
+
+# Upper bound for an endpoint fetch running as a background task.
+BACKGROUND_FETCH_TIMEOUT = 120
+
+# Learned report cadence: weight of the newest interval in the moving average,
+# the range of intervals accepted as samples, the delay after an expected
+# report before fetching it, and the longest a state fetch is ever put off.
+REPORT_CADENCE_SMOOTHING = 0.3
+REPORT_INTERVAL_MIN = 30
+REPORT_INTERVAL_MAX = 6 * 3600
+REPORT_GRACE = 15
+REPORT_STATE_TTL_MAX = 1800
+
+
+class PhynReportCadence:
+    """Moving-average estimate of how often a device reports new readings."""
+
+    __slots__ = ("interval", "last_report")
+
+    def __init__(self, interval: float | None = None) -> None:
+        """Initialize the estimate."""
+        self.interval = interval
+        self.last_report: float | None = None
+
+    def observe(self, reported_at: float | None) -> None:
+        """Record the device's latest report time (epoch seconds)."""
+        if reported_at is None:
+            return
+        last_report = self.last_report
+        if last_report is not None and reported_at <= last_report:
+            return
+        self.last_report = reported_at
+        if last_report is None:
+            return
+        sample = reported_at - last_report
+        if not REPORT_INTERVAL_MIN <= sample <= REPORT_INTERVAL_MAX:
+            return
+        if self.interval is None:
+            self.interval = sample
+        else:
+            self.interval += REPORT_CADENCE_SMOOTHING * (sample - self.interval)
+
+    def next_report_at(self) -> float | None:
+        """Return when the next report is expected, once the cadence is known."""
+        if self.interval is None or self.last_report is None:
+            return None
+        return self.last_report + self.interval
+
+
 class PhynDevice:
     """Generic Phyn Device"""
 
@@ -18,6 +83,24 @@ class PhynDevice:
     #: coordinator can request only the relevant union per home.
     ALERT_EVENT_TYPES: list[str] = []
 
+    #: Minimum number of seconds between REST fetches of each endpoint.
+    #: Subclasses extend this with the endpoints they poll.  Cached values are
+    #: reused until their TTL expires or a ``set_*`` call invalidates them.
+    POLL_SCHEDULE: dict[str, int] = {
+        "state": 60,
+        "firmware": 3600,
+    }
+
+    #: Endpoints whose first fetch is slow and not needed for entities to come
+    #: up.  Until such an endpoint has been fetched once, it runs as a
+    #: background task instead of holding up the poll.
+    BACKGROUND_FIRST_FETCH: frozenset[str] = frozenset({"firmware"})
+
+    #: Models without a push stream set this to fetch state just after each
+    #: expected report, learned from the reading timestamps, instead of on
+    #: the fixed POLL_SCHEDULE.
+    LEARN_REPORT_CADENCE: bool = False
+
     def __init__(
         self,
         coordinator: PhynDataUpdateCoordinator,
@@ -33,21 +116,25 @@ class PhynDevice:
         self._phyn_device_id: str = device_id
         self._product_code: str = product_code
         self._manufacturer: str = "Phyn"
-        self._device_state: dict[str, Any] = {}
+        self._device_state: PhynDeviceState = PhynDeviceState()
         self._device_preferences: dict[str, dict[str, Any]] = {}
         self._firmware_info: dict[str, Any] = {}
         self._active_alerts: dict[str, int] = {}
         self._latest_device_alerts: list[dict] = []
-        self._update_count: int = 0
+        self._ongoing_alert_types: set[str] = set()
+        self._endpoint_fetched_at: dict[str, float] = {}
+        self._background_fetches: dict[str, asyncio.Task[None]] = {}
+        self._report_cadence = PhynReportCadence()
+        self._breakers: dict[str, PhynCircuitBreaker] = {}
+        self.entities: list[PhynEntity] = []
         self._alert_listeners: list[Callable[[dict], None]] = []
-        self._seen_alert_ids: set[str] = set()
-        self._alert_seed_done: bool = False
     
     @property
     def available(self) -> bool:
         """Return True if device is available."""
-        online_status = self._device_state.get("online_status", {})
-        return online_status.get("v") == "online"
+        if self._coordinator.device_update_failed(self._phyn_device_id):
+            return False
+        return self._device_state.online
     
     @property
     def coordinator(self) -> PhynDataUpdateCoordinator:
@@ -73,7 +160,7 @@ class PhynDevice:
         if "fw_version" not in self._firmware_info:
             return None
         fw_version = self._firmware_info.get("fw_version")
-        device_fw = self._device_state.get("fw_version")
+        device_fw = self._device_state.fw_version
         if fw_version and device_fw:
             return int(fw_version) > int(device_fw)
         return False
@@ -95,7 +182,7 @@ class PhynDevice:
     @property
     def firmware_version(self) -> str:
         """Return the firmware version for the device."""
-        return self._device_state.get("fw_version", "")
+        return self._device_state.fw_version
 
     @property
     def home_id(self) -> str:
@@ -115,29 +202,225 @@ class PhynDevice:
     @property
     def model(self) -> str:
         """Return model for device."""
-        return self._device_state.get("product_code", "")
+        return self._device_state.product_code
 
     @property
     def rssi(self) -> float | None:
         """Return rssi for device."""
-        return self._device_state.get("signal_strength")
+        return self._device_state.signal_strength
 
     @property
     def serial_number(self) -> str:
         """Return the serial number for the device."""
-        return self._device_state.get("serial_number", "")
+        return self._device_state.serial_number
     
+    def snapshot(self) -> PhynDeviceSnapshot:
+        """Return an immutable snapshot of the device's entity states."""
+        return MappingProxyType({
+            entity._entity_type: entity.snapshot_value()
+            for entity in self.entities
+            if entity.tracks_snapshot
+        })
+
+    def cache_data(self) -> dict[str, Any]:
+        """Return the last-known data persisted for a warm start."""
+        return {
+            "state": self._device_state.as_dict(),
+            "preferences": self._device_preferences,
+            "firmware": self._firmware_info,
+            "report_interval": self._report_cadence.interval,
+        }
+
+    def restore_cache(self, data: Mapping[str, Any]) -> None:
+        """Seed the device from data returned by a previous ``cache_data``.
+
+        Restored values carry no fetch time, so every endpoint is still due on
+        the first poll and any fresher value replaces them.
+        """
+        self._device_state.update(data.get("state", {}))
+        self._device_preferences.update(data.get("preferences", {}))
+        self._firmware_info.update(data.get("firmware", {}))
+        self._report_cadence = PhynReportCadence(data.get("report_interval"))
+
+    @property
+    def mqtt_topic(self) -> str | None:
+        """Return the MQTT topic carrying real-time updates, if the model has one."""
+        return None
+
+    async def on_device_update(self, device_id: str, data: dict[str, Any]) -> None:
+        """Handle a real-time MQTT update routed by the coordinator."""
+
     async def async_setup(self) -> None:
         """Setup the device. Override in subclasses if needed."""
         pass
 
+    @callback
+    def async_shutdown(self) -> None:
+        """Cancel pending work when the entry unloads. Override in subclasses if needed."""
+
     async def async_update_data(self) -> None:
         """Update device data. Must be overridden by subclasses."""
         pass
 
+    def _endpoint_due(self, endpoint: str) -> bool:
+        """Return True if the cached data for *endpoint* has expired.
+
+        Endpoints are skipped while their circuit breaker is open.  State has
+        no breaker: its failures are accounted for by the coordinator, which
+        marks the device unavailable.
+        """
+        breaker = self._breakers.get(endpoint)
+        if breaker is not None and breaker.is_open:
+            return False
+        fetched_at = self._endpoint_fetched_at.get(endpoint)
+        if fetched_at is None:
+            return True
+        ttl = self._endpoint_ttl(endpoint)
+        return time.monotonic() - fetched_at >= ttl - POLL_SCHEDULE_SLACK
+
+    def _endpoint_ttl(self, endpoint: str) -> float:
+        """Return the current TTL for *endpoint*. Override to adapt the schedule."""
+        ttl: float = self.POLL_SCHEDULE.get(endpoint, 0)
+        if endpoint == "state" and self.LEARN_REPORT_CADENCE:
+            next_report_at = self._report_cadence.next_report_at()
+            if next_report_at is not None:
+                # Wait until just after the expected report.  Once that has
+                # passed without a new reading, fall back to the regular TTL.
+                fetched_ago = time.monotonic() - self._endpoint_fetched_at.get(
+                    endpoint, time.monotonic()
+                )
+                due_in = next_report_at + REPORT_GRACE - (time.time() - fetched_ago)
+                ttl = min(max(ttl, due_in), REPORT_STATE_TTL_MAX)
+        return ttl
+
+    def _mark_endpoint_fresh(self, endpoint: str) -> None:
+        """Record that *endpoint* has just been refreshed."""
+        self._endpoint_fetched_at[endpoint] = time.monotonic()
+
+    def invalidate_endpoint(self, *endpoints: str) -> None:
+        """Expire cached endpoint data so the next poll fetches it again.
+
+        An endpoint whose circuit breaker is open stays skipped until its
+        backoff ends.
+        """
+        for endpoint in endpoints:
+            self._endpoint_fetched_at.pop(endpoint, None)
+
+    def _scheduled_fetchers(
+        self, fetchers: dict[str, Callable[[], Awaitable[None]]]
+    ) -> list[Callable[[], Awaitable[None]]]:
+        """Return the fetchers whose endpoint is due according to POLL_SCHEDULE.
+
+        The first fetch of a BACKGROUND_FIRST_FETCH endpoint is started as a
+        background task rather than returned.
+        """
+        due: list[Callable[[], Awaitable[None]]] = []
+        for endpoint, fetch in fetchers.items():
+            if not self._endpoint_due(endpoint):
+                continue
+            if (
+                endpoint in self.BACKGROUND_FIRST_FETCH
+                and endpoint not in self._endpoint_fetched_at
+            ):
+                self._start_background_fetch(endpoint, fetch)
+                continue
+            due.append(partial(self._async_fetch_endpoint, endpoint, fetch))
+        return due
+
+    async def _async_fetch_endpoint(
+        self, endpoint: str, fetch: Callable[[], Awaitable[None]]
+    ) -> None:
+        """Run *fetch* and record the outcome in the endpoint's circuit breaker.
+
+        Only state failures fail the device poll; the coordinator accounts
+        for them.  Any other endpoint keeps its last value and is backed off
+        by its breaker.
+        """
+        try:
+            await fetch()
+        except AuthenticationError:
+            raise
+        except Exception as err:
+            if endpoint == "state":
+                raise
+            self._record_endpoint_failure(endpoint, err)
+            return
+        if (breaker := self._breakers.get(endpoint)) is not None:
+            if breaker.failures:
+                LOGGER.info("%s %s recovered", self.device_name, endpoint)
+            breaker.record_success()
+        self._mark_endpoint_fresh(endpoint)
+
+    def _record_endpoint_failure(self, endpoint: str, err: Exception) -> None:
+        """Count a failed fetch against the endpoint's circuit breaker."""
+        breaker = self._breakers.setdefault(endpoint, PhynCircuitBreaker())
+        backoff = breaker.record_failure()
+        if backoff is None:
+            LOGGER.debug("%s %s fetch failed: %s", self.device_name, endpoint, err)
+        else:
+            LOGGER.warning(
+                "%s %s failed %d times in a row (%s); retrying in %d s",
+                self.device_name, endpoint, breaker.failures, err, backoff,
+            )
+
+    def _start_background_fetch(
+        self, endpoint: str, fetch: Callable[[], Awaitable[None]]
+    ) -> None:
+        """Run *fetch* as a background task unless one is already running."""
+        task = self._background_fetches.get(endpoint)
+        if task is not None and not task.done():
+            return
+        self._background_fetches[endpoint] = (
+            self._coordinator.config_entry.async_create_background_task(
+                self._coordinator.hass,
+                self._async_background_fetch(endpoint, fetch),
+                f"phyn {self._phyn_device_id} {endpoint} fetch",
+            )
+        )
+
+    async def _async_background_fetch(
+        self, endpoint: str, fetch: Callable[[], Awaitable[None]]
+    ) -> None:
+        """Await a background fetch and publish what it changed."""
+
+        async def _fetch_with_timeout() -> None:
+            async with asyncio.timeout(BACKGROUND_FETCH_TIMEOUT):
+                await fetch()
+
+        try:
+            await self._async_fetch_endpoint(endpoint, _fetch_with_timeout)
+        except AuthenticationError as err:
+            # The next state poll reports it to the coordinator.
+            LOGGER.debug("Background %s fetch for %s failed: %s", endpoint, self.device_name, err)
+            return
+        self._coordinator.async_publish_device(self)
+
+    async def _async_run_fetch_plan(
+        self, stages: list[list[Callable[[], Awaitable[None]]]]
+    ) -> None:
+        """Run a dependency-ordered fetch plan.
+
+        Each stage is a list of independent fetchers that are awaited
+        concurrently; a stage only starts once every fetcher in the previous
+        stage has finished.  The first error raised by a fetcher is propagated
+        after its siblings complete.
+        """
+        for stage in stages:
+            if len(stage) == 1:
+                await stage[0]()
+                continue
+            results = await asyncio.gather(
+                *(fetch() for fetch in stage), return_exceptions=True
+            )
+            for result in results:
+                if isinstance(result, BaseException):
+                    raise result
+
     async def _update_firmware_information(self, *_) -> None:
         self._firmware_info.update(
-            (await self._coordinator.api_client.device.get_latest_firmware_info(self._phyn_device_id))[0]
+            await self._coordinator.firmware_cache.async_get(
+                self._product_code, self._phyn_device_id
+            )
         )
         LOGGER.debug("%s firmware: %s", self.device_name, self._firmware_info)
 
@@ -151,13 +434,7 @@ class PhynDevice:
         so it catches alerts that have been read/acknowledged in the Phyn app
         but whose underlying condition (e.g. low battery) is still present.
         """
-        for alert in self._latest_device_alerts:
-            a_type = alert.get("alert_type") or alert.get("type")
-            if a_type != alert_type:
-                continue
-            if alert.get("active") == "Y" or alert.get("ongoing") is True:
-                return True
-        return False
+        return alert_type in self._ongoing_alert_types
 
     def add_alert_listener(self, cb: Callable[[dict], None]) -> Callable[[], None]:
         """Register a callback invoked for each new (unseen, non-excluded) alert.
@@ -182,44 +459,49 @@ class PhynDevice:
 
         Uses the ``/alerts/latest`` endpoint (returning rich per-alert objects)
         rather than the active-summary, so each discrete alert occurrence is
-        caught exactly once.  On the very first run the existing alert IDs are
-        seeded into the seen-set to prevent a notification storm on startup.
+        caught exactly once.  Seen IDs live in the coordinator's persistent
+        store; the first time a device is processed its existing alert IDs are
+        seeded into it to prevent a notification storm.
         """
         from ..const import CONF_EXCLUDED_ALERT_TYPES
         excluded: set[str] = set(
             self._coordinator.config_entry.options.get(CONF_EXCLUDED_ALERT_TYPES, [])
         )
 
-        alerts: list[dict] = self._coordinator._alert_latest_by_home.get(self._phyn_home_id, [])
-        LOGGER.debug("Latest alerts (home %s): %d", self._phyn_home_id, len(alerts))
-
-        # Filter to alerts that belong to this device.
-        device_alerts = [
-            a for a in alerts
-            if a.get("device_id") == self._phyn_device_id
-        ]
+        # The coordinator partitions the fetched alerts per device each cycle.
+        device_alerts: list[dict] = self._coordinator._alert_latest_by_device.get(
+            self._phyn_device_id, []
+        )
+        LOGGER.debug("Latest alerts (device %s): %d", self._phyn_device_id, len(device_alerts))
 
         self._latest_device_alerts = device_alerts
-
-        if not self._alert_seed_done:
-            # Record all current IDs so we don't replay history on restart.
+        self._ongoing_alert_types = {
+            alert.get("alert_type") or alert.get("type") or ""
+            for alert in device_alerts
+            if alert.get("active") == "Y" or alert.get("ongoing") is True
+        }
+
+        seen_alerts = self._coordinator.seen_alerts
+        if not seen_alerts.device_seeded(self._phyn_device_id):
+            # Record all current IDs so we don't replay history.
             for alert in device_alerts:
                 alert_id = alert.get("id")
                 if alert_id is not None:
-                    self._seen_alert_ids.add(alert_id)
-            self._alert_seed_done = True
+                    seen_alerts.touch(alert_id)
+            seen_alerts.mark_device_seeded(self._phyn_device_id)
             LOGGER.debug(
                 "Seeded %d existing alert IDs for %s",
-                len(self._seen_alert_ids),
+                len(device_alerts),
                 self._phyn_device_id,
             )
             return
 
         for alert in device_alerts:
             alert_id = alert.get("id")
-            if alert_id is None or alert_id in self._seen_alert_ids:
+            # Touching also refreshes IDs the API still returns, so they are
+            # retained for as long as they could be mistaken for new alerts.
+            if alert_id is None or not seen_alerts.touch(alert_id):
                 continue
-            self._seen_alert_ids.add(alert_id)
 
             alert_type = alert.get("alert_type") or alert.get("type") or ""
             if alert_type in excluded:
@@ -235,8 +517,8 @@ class PhynDevice:
 
     async def _update_device_state(self, *_) -> None:
         """Update the device state from the API."""
-        if 'last_updated' not in self._device_state or self._device_state['last_updated'] <= (math.floor(time.time()) - 60):
-            self._device_state.update(await self._coordinator.api_client.device.get_state( 
-                self._phyn_device_id
-            ))
-            self._device_state['last_updated'] = math.floor(time.time())
+        requested_at, state_data = await self._coordinator.api_client.async_read_timed(
+            "device.get_state", self._phyn_device_id
+        )
+        self._device_state.update(state_data, requested_at)
+        self._report_cadence.observe(self._device_state.reported_at)
@@ -1,5 +1,6 @@
 """Support for Phyn Classic Water Monitor sensors."""
 from __future__ import annotations
+from collections.abc import Mapping
 from typing import TYPE_CHECKING, Any
 
 from aiophyn.errors import RequestError
@@ -39,6 +40,7 @@ from ..entities.base import (
     PhynPressureSensor,
 )
 from .base import PhynDevice
+from .state import PhynClassicState
 
 if TYPE_CHECKING:
     from ..update_coordinator import PhynDataUpdateCoordinator
@@ -57,6 +59,12 @@ class PhynClassicDevice(PhynDevice):
         "temperature",
     ]
 
+    POLL_SCHEDULE: dict[str, int] = {
+        **PhynDevice.POLL_SCHEDULE,
+        "consumption": 60,
+    }
+    LEARN_REPORT_CADENCE = True
+
     def __init__(
         self,
         coordinator: PhynDataUpdateCoordinator,
@@ -67,10 +75,7 @@ class PhynClassicDevice(PhynDevice):
     ) -> None:
         """Initialize the device."""
         super().__init__(coordinator, home_id, device_id, product_code, home_name)
-        self._device_state: dict[str, Any] = {
-            "cold_line_num": None,
-            "hot_line_num": None,
-        }
+        self._device_state: PhynClassicState = PhynClassicState()
         self._away_mode: dict[str, Any] = {}
         self._water_usage: dict[str, Any] = {}
         self._last_known_valve_state: bool = True
@@ -98,16 +103,15 @@ class PhynClassicDevice(PhynDevice):
         """Update data via library."""
         try:
             async with timeout(20):
-                await self._update_device_state()
-                await self._update_alerts()
-                await self._update_alert_events()
-                await self._update_consumption_data()
-
-                #Update every hour
-                if self._update_count % 60 == 0:
-                    await self._update_firmware_information()
-
-                self._update_count += 1
+                fetchers = self._scheduled_fetchers({
+                    "state": self._update_device_state,
+                    "consumption": self._update_consumption_data,
+                    "firmware": self._update_firmware_information,
+                })
+                await self._async_run_fetch_plan([
+                    fetchers,
+                    [self._update_alerts, self._update_alert_events],
+                ])
         except (RequestError) as error:
             raise UpdateFailed(error) from error
 
@@ -146,7 +150,7 @@ class PhynClassicDevice(PhynDevice):
     @property
     def cold_line_num(self) -> int | None:
         """Return cold line number"""
-        return self._device_state.get('cold_line_num')
+        return self._device_state.cold_line_num
 
     @property
     def consumption_today(self) -> float | None:
@@ -156,53 +160,46 @@ class PhynClassicDevice(PhynDevice):
     @property
     def current_flow_rate(self) -> float | None:
         """Return current flow rate in gpm."""
-        flow = self._device_state.get("flow", {})
-        if "v" not in flow:
-            return None
-        return round(flow["v"], 3)
+        return self._device_state.flow_rate
 
     @property
     def current_psi1(self) -> float:
         """Return the current pressure in psi."""
-        pressure1 = self._device_state.get("pressure1", {})
-        if "v" in pressure1:
-            return round(pressure1["v"], 2)
-        return round(pressure1.get("mean", 0), 2)
+        return self._device_state.psi1
 
     @property
     def current_psi2(self) -> float:
         """Return the current pressure in psi."""
-        pressure2 = self._device_state.get("pressure2", {})
-        if "v" in pressure2:
-            return round(pressure2["v"], 2)
-        return round(pressure2.get("mean", 0), 2)
+        return self._device_state.psi2
 
     @property
     def hot_line_num(self) -> int | None:
         """Return hot line number"""
-        return self._device_state.get('hot_line_num')
+        return self._device_state.hot_line_num
 
     @property
     def leak_test_running(self) -> bool:
         """Check if a leak test is running"""
-        sov_status = self._device_state.get("sov_status", {})
-        return sov_status.get("v") == "LeakExp"
+        return self._device_state.sov_status == "LeakExp"
 
     @property
     def temperature1(self) -> float:
         """Return the current temperature in degrees F."""
-        temp1 = self._device_state.get("temperature1", {})
-        if "v" in temp1:
-            return round(temp1["v"], 2)
-        return round(temp1.get("mean", 0), 2)
+        return self._device_state.temperature1
 
     @property
     def temperature2(self) -> float:
         """Return the current temperature in degrees F."""
-        temp2 = self._device_state.get("temperature2", {})
-        if "v" in temp2:
-            return round(temp2["v"], 2)
-        return round(temp2.get("mean", 0), 2)
+        return self._device_state.temperature2
+
+    def cache_data(self) -> dict[str, Any]:
+        """Return the last-known data persisted for a warm start."""
+        return {**super().cache_data(), "consumption": self._water_usage}
+
+    def restore_cache(self, data: Mapping[str, Any]) -> None:
+        """Seed the device from data returned by a previous ``cache_data``."""
+        super().restore_cache(data)
+        self._water_usage = dict(data.get("consumption", {}))
 
     async def _update_consumption_data(self, *_) -> None:
         """Update water consumption data from the API."""
@@ -1,16 +1,20 @@
 """Support for Phyn Plus Water Monitor sensors."""
 from __future__ import annotations
+from collections.abc import Mapping
 from typing import TYPE_CHECKING, Any
 
 from aiophyn.errors import RequestError
 from asyncio import Lock, timeout
 
+from homeassistant.core import CALLBACK_TYPE, HassJob, callback
+from homeassistant.helpers.event import async_call_later
 from homeassistant.helpers.update_coordinator import UpdateFailed
 import homeassistant.util.dt as dt_util
 
-from ..const import LOGGER
+from ..const import CONF_PUSH_COALESCE_SECONDS, DEFAULT_PUSH_COALESCE_SECONDS, LOGGER
 from ..entities.base import (
     PhynAlertEvent,
+    PhynEntity,
     PhynAlertSensor,
     PhynDailyUsageSensor,
     PhynFirmwareUpdateAvailableSensor,
@@ -31,8 +35,8 @@ from ..entities.pp import (
     PhynValve,
 )
 from .base import PhynDevice
+from .state import PhynPlusState
 
-import math
 import time
 
 if TYPE_CHECKING:
@@ -41,6 +45,24 @@ if TYPE_CHECKING:
 NAME_WATER_TEMPERATURE = "Current water temperature"
 NAME_WATER_PRESSURE = "Current water pressure"
 
+# While MQTT pushes keep arriving, REST state polling drops to a slow
+# reconciliation pass that picks up fields pushes never carry (online status,
+# firmware version, ...).  Once pushes go quiet for PUSH_STALE_AFTER seconds,
+# or MQTT disconnects, the regular POLL_SCHEDULE rate applies again.
+PUSH_STALE_AFTER = 180
+PUSH_STATE_RECONCILE_INTERVAL = 900
+
+# Device-state fields carried by MQTT pushes, mapped to the entity types whose
+# values derive from them.  A push only writes the entities of changed fields.
+PUSH_FIELD_ENTITIES: dict[str, tuple[str, ...]] = {
+    "consumption": ("consumption",),
+    "flow": ("current_flow_rate",),
+    "flow_state": ("water_flow_state",),
+    "pressure": ("pressure",),
+    "sov_status": ("leak_test_running", "shutoff_valve"),
+    "temperature": ("temperature",),
+}
+
 class PhynPlusDevice(PhynDevice):
     """Phyn device object."""
 
@@ -55,6 +77,20 @@ class PhynPlusDevice(PhynDevice):
         "temperature",
     ]
 
+    # Preferences and auto-shutoff can also be changed from the Phyn app, so
+    # they are re-read every 10 minutes; a set_* method invalidates the
+    # cached value right away.
+    POLL_SCHEDULE: dict[str, int] = {
+        **PhynDevice.POLL_SCHEDULE,
+        "autoshutoff": 600,
+        "preferences": 600,
+        "consumption": 60,
+        "health_tests": 600,
+    }
+    BACKGROUND_FIRST_FETCH: frozenset[str] = (
+        PhynDevice.BACKGROUND_FIRST_FETCH | {"health_tests"}
+    )
+
     def __init__(
         self,
         coordinator: PhynDataUpdateCoordinator,
@@ -65,12 +101,7 @@ class PhynPlusDevice(PhynDevice):
     ) -> None:
         """Initialize the device."""
         super().__init__(coordinator, home_id, device_id, product_code, home_name)
-        self._device_state: dict[str, Any] = {
-            "flow_state": {
-                "v": 0.0,
-                "ts": 0,
-            }
-        }
+        self._device_state: PhynPlusState = PhynPlusState()
         self._auto_shutoff: dict[str, Any] = {}
         self._away_mode: dict[str, Any] = {}
         self._water_usage: dict[str, Any] = {}
@@ -78,6 +109,9 @@ class PhynPlusDevice(PhynDevice):
         self._latest_health_test: dict[str, Any] | None = None
         self._rt_device_state: dict[str, Any] = {}
         self._state_lock: Lock = Lock()
+        self._last_push_at: float | None = None
+        self._pending_push_writes: set[PhynEntity] = set()
+        self._push_flush_unsub: CALLBACK_TYPE | None = None
 
         self.entities = [
             PhynAlertEvent(self),
@@ -106,26 +140,32 @@ class PhynPlusDevice(PhynDevice):
             PhynValve(self),
         ]
 
+        entities_by_type = {entity._entity_type: entity for entity in self.entities}
+        self._push_entities: dict[str, list[PhynEntity]] = {
+            field: [entities_by_type[t] for t in entity_types if t in entities_by_type]
+            for field, entity_types in PUSH_FIELD_ENTITIES.items()
+        }
+
     async def async_update_data(self):
         """Update data via library."""
         try:
             async with timeout(20):
-                await self._update_device_state()
-                await self._update_alerts()
-                await self._update_alert_events()
-                await self._update_autoshutoff()
-                await self._update_device_preferences()
-                await self._update_consumption_data()
-
-                #Update every 10 minutes
-                if self._update_count % 10 == 0:
-                    await self._update_device_health_tests()
-
-                #Update every hour
-                if (self._update_count % 60 == 0):
-                    await self._update_firmware_information()
-                
-                self._update_count += 1
+                # Remote endpoints are independent of each other and run
+                # concurrently; _update_device_state still serialises against
+                # MQTT pushes through _state_lock.  Alert processing only reads
+                # coordinator caches and runs once the fetches are in.
+                fetchers = self._scheduled_fetchers({
+                    "state": self._update_device_state,
+                    "autoshutoff": self._update_autoshutoff,
+                    "preferences": self._update_device_preferences,
+                    "consumption": self._update_consumption_data,
+                    "health_tests": self._update_device_health_tests,
+                    "firmware": self._update_firmware_information,
+                })
+                await self._async_run_fetch_plan([
+                    fetchers,
+                    [self._update_alerts, self._update_alert_events],
+                ])
         except (RequestError) as error:
             raise UpdateFailed(error) from error
 
@@ -134,7 +174,7 @@ class PhynPlusDevice(PhynDevice):
         """Return the current consumption for today in gallons."""
         if "consumption" not in self._rt_device_state:
             return None
-        return self._device_state.get("consumption")
+        return self._device_state.consumption
 
     @property
     def consumption_today(self) -> float | None:
@@ -144,32 +184,29 @@ class PhynPlusDevice(PhynDevice):
     @property
     def current_flow_rate(self) -> float | None:
         """Return current flow rate in gpm."""
-        flow = self._device_state.get("flow", {})
-        if "v" not in flow:
-            return None
-        return round(flow["v"], 3)
+        return self._device_state.flow_rate
 
     @property
     def current_psi(self) -> float:
         """Return the current pressure in psi."""
-        pressure = self._device_state.get("pressure", {})
-        if "v" in pressure:
-            return round(pressure["v"], 2)
-        return round(pressure.get("mean", 0), 2)
+        return self._device_state.psi
+
+    @property
+    def flow_state(self) -> str | None:
+        """Return the flow state reported by the latest real-time update."""
+        if "flow_state" not in self._rt_device_state:
+            return None
+        return self._device_state.flow_state
 
     @property
     def leak_test_running(self) -> bool:
         """Check if a leak test is running"""
-        sov_status = self._device_state.get("sov_status", {})
-        return sov_status.get("v") == "LeakExp"
+        return self._device_state.sov_status == "LeakExp"
 
     @property
     def temperature(self) -> float:
         """Return the current temperature in degrees F."""
-        temp = self._device_state.get("temperature", {})
-        if "v" in temp:
-            return round(temp["v"], 2)
-        return round(temp.get("mean", 0), 2)
+        return self._device_state.temperature
 
     @property
     def scheduled_leak_test_enabled(self) -> bool | None:
@@ -217,22 +254,17 @@ class PhynPlusDevice(PhynDevice):
         """Return the valve state for the device."""
         if self.valve_changing:
             return self._last_known_valve_state
-        sov_status = self._device_state.get("sov_status", {})
-        return sov_status.get("v") == "Open"
+        return self._device_state.sov_status == "Open"
 
     @property
     def valve_changing(self) -> bool:
         """Return the valve changing status"""
-        sov_status = self._device_state.get("sov_status", {})
-        return sov_status.get("v") == "Partial"
+        return self._device_state.sov_status == "Partial"
 
-    async def async_setup(self) -> str:  # type: ignore[override]
-        """Setup a new device coordinator"""
-        LOGGER.debug("Setting up coordinator")
-
-        await self._coordinator.api_client.mqtt.add_event_handler("update", self.on_device_update)
-        await self._coordinator.api_client.mqtt.subscribe(f"prd/app_subscriptions/{self._phyn_device_id}")
-        return self._device_state["sov_status"]["v"]
+    @property
+    def mqtt_topic(self) -> str:
+        """Return the MQTT topic carrying this device's real-time updates."""
+        return f"prd/app_subscriptions/{self._phyn_device_id}"
     
     @property
     def autoshutoff_enabled(self) -> bool | None:
@@ -245,6 +277,7 @@ class PhynPlusDevice(PhynDevice):
         LOGGER.debug("Setting auto shutoff state: %s" % state)
         await self._coordinator.api_client.device.set_autoshutoff_enabled(self._phyn_device_id, state)
         self._auto_shutoff["auto_shutoff_enable"] = state
+        self.invalidate_endpoint("autoshutoff")
 
     @property
     def away_mode(self) -> bool | None:
@@ -270,6 +303,7 @@ class PhynPlusDevice(PhynDevice):
         if name not in self._device_preferences:
             self._device_preferences[name] = {}
         self._device_preferences[name]["value"] = val
+        self.invalidate_endpoint("preferences")
     
     async def set_away_mode(self, state: bool) -> None:
         """Manually set away mode value"""
@@ -282,6 +316,7 @@ class PhynPlusDevice(PhynDevice):
         }]
         await self._coordinator.api_client.device.set_device_preferences(self._phyn_device_id, params)
         self._device_preferences[key]["value"] = val
+        self.invalidate_endpoint("preferences")
 
     async def set_scheduler_enabled(self, state: bool) -> None:
         """Manually set the scheduler enabled mode"""
@@ -294,6 +329,7 @@ class PhynPlusDevice(PhynDevice):
         }]
         await self._coordinator.api_client.device.set_device_preferences(self._phyn_device_id, params)
         self._device_preferences[key]["value"] = val
+        self.invalidate_endpoint("preferences")
     
     async def _update_autoshutoff(self, *_) -> None:
         """Update auto shutoff status"""
@@ -325,12 +361,7 @@ class PhynPlusDevice(PhynDevice):
     
     async def _update_device_health_tests(self, *_) -> None:
         """Update the latest health test"""
-        try: 
-            data = await self._coordinator.api_client.device.get_health_tests(self._phyn_device_id)
-        except Exception as error:
-            LOGGER.error("Error getting health tests: %s" % error)
-            self._latest_health_test = None
-            return
+        data = await self._coordinator.api_client.device.get_health_tests(self._phyn_device_id)
         latest_test = None
         LOGGER.debug("Health data: %s" % data)
         for test in data['data']:
@@ -339,32 +370,66 @@ class PhynPlusDevice(PhynDevice):
         
         self._latest_health_test = latest_test        
 
+    @property
+    def push_active(self) -> bool:
+        """Return True if MQTT is connected and pushes for this device are fresh."""
+        if self._last_push_at is None:
+            return False
+        if time.monotonic() - self._last_push_at > PUSH_STALE_AFTER:
+            return False
+        return self._coordinator.api_client.mqtt.is_connected()
+
+    def _endpoint_ttl(self, endpoint: str) -> float:
+        """Stretch the state TTL while MQTT pushes keep the state current."""
+        if endpoint == "state" and self.push_active:
+            return PUSH_STATE_RECONCILE_INTERVAL
+        return super()._endpoint_ttl(endpoint)
+
+    def cache_data(self) -> dict[str, Any]:
+        """Return the last-known data persisted for a warm start."""
+        return {
+            **super().cache_data(),
+            "autoshutoff": self._auto_shutoff,
+            "consumption": self._water_usage,
+        }
+
+    def restore_cache(self, data: Mapping[str, Any]) -> None:
+        """Seed the device from data returned by a previous ``cache_data``."""
+        super().restore_cache(data)
+        self._auto_shutoff.update(data.get("autoshutoff", {}))
+        self._water_usage = dict(data.get("consumption", {}))
+        self._update_last_known_valve_state()
+
     def _update_last_known_valve_state(self) -> None:
         """Update last known valve state from device state. Must be called within _state_lock."""
-        sov_status = self._device_state.get("sov_status", {})
-        if sov_status.get("v") != "Partial":
-            self._last_known_valve_state = sov_status.get("v") == "Open"
+        sov_status = self._device_state.sov_status
+        if sov_status != "Partial":
+            self._last_known_valve_state = sov_status == "Open"
 
     async def _update_device_state(self, *_) -> None:
-        """Update the device state from the API."""
+        """Update the device state from the API.
+
+        The HTTP round trip runs outside _state_lock so MQTT pushes are never
+        held up by it; the response is then merged field by field, keeping
+        any value a push delivered while the request was in flight.
+        """
+        requested_at, state_data = await self._coordinator.api_client.async_read_timed(
+            "device.get_state", self._phyn_device_id
+        )
         async with self._state_lock:
-            if 'last_updated' not in self._device_state or self._device_state['last_updated'] <= (math.floor(time.time()) - 60):
-                state_data = await self._coordinator.api_client.device.get_state(
-                    self._phyn_device_id
-                )
-                self._device_state.update(state_data)
-                self._device_state['last_updated'] = math.floor(time.time())
-                self._update_last_known_valve_state()
+            self._device_state.update(state_data, requested_at)
+            self._update_last_known_valve_state()
 
-    async def on_device_update(self, device_id, data):
+    async def on_device_update(self, device_id: str, data: dict[str, Any]) -> None:
+        """Apply a real-time update routed here by the coordinator."""
         if device_id == self._phyn_device_id:
             async with self._state_lock:
+                previous_rt = self._rt_device_state
                 self._rt_device_state = data
 
                 update_data = {}
                 if "consumption" in data:
-                    # Round consumption down to 2 decimal points.
-                    update_data.update({"consumption": math.floor(data["consumption"]["v"] * 100) / 100})
+                    update_data.update({"consumption": data["consumption"]})
                 if "flow" in data:
                     update_data.update({"flow": data["flow"]})
                 if "flow_state" in data:
@@ -376,13 +441,52 @@ class PhynPlusDevice(PhynDevice):
                         update_data.update({"pressure": data["sensor_data"]["pressure"]})
                     if "temperature" in data["sensor_data"]:
                         update_data.update({"temperature": data["sensor_data"]["temperature"]})
-                self._device_state.update(update_data)
-                self._device_state['last_updated'] = math.floor(time.time())
+
+                changed = self._device_state.update(update_data, time.time())
+                # Consumption and flow state are read from the latest raw push,
+                # so their entities also change when the field appears or
+                # disappears from the message.
+                for field in ("consumption", "flow_state"):
+                    if (field in previous_rt) != (field in data):
+                        changed.add(field)
+
+                self._last_push_at = time.monotonic()
                 self._update_last_known_valve_state()
                 LOGGER.debug("Updating device %s Device State: %s", self._phyn_device_id, self._device_state)
 
-            for entity in self.entities:
-                # Skip entities that aren't fully initialized yet
-                if getattr(entity, "hass", None) is None:
-                    continue
-                entity.async_write_ha_state()
+            for field in changed:
+                self._pending_push_writes.update(self._push_entities.get(field, ()))
+            if not self._pending_push_writes:
+                return
+
+            window = float(self._coordinator.config_entry.options.get(
+                CONF_PUSH_COALESCE_SECONDS, DEFAULT_PUSH_COALESCE_SECONDS
+            ))
+            if window <= 0:
+                self._flush_push_writes()
+            elif self._push_flush_unsub is None:
+                self._push_flush_unsub = async_call_later(
+                    self._coordinator.hass,
+                    window,
+                    HassJob(self._flush_push_writes, cancel_on_shutdown=True),
+                )
+
+    @callback
+    def async_shutdown(self) -> None:
+        """Drop the pending push flush so removed entities are not written."""
+        if self._push_flush_unsub is not None:
+            self._push_flush_unsub()
+            self._push_flush_unsub = None
+        self._pending_push_writes.clear()
+
+    @callback
+    def _flush_push_writes(self, *_: Any) -> None:
+        """Write the entities affected by pushes since the last flush."""
+        self._push_flush_unsub = None
+        entities, self._pending_push_writes = self._pending_push_writes, set()
+        for entity in entities:
+            # Skip entities that aren't fully initialized yet
+            if getattr(entity, "hass", None) is None:
+                continue
+            entity.async_write_ha_state()
+
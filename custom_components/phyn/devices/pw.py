@@ -1,24 +1,27 @@
 """Support for Phyn Water Sensors."""
 from __future__ import annotations
 
-from collections import defaultdict
+from collections.abc import Mapping
 from datetime import datetime
+import time
 from typing import TYPE_CHECKING, Any
 
 from aiophyn.errors import RequestError
 
+from homeassistant.components.recorder import get_instance
 from homeassistant.components.recorder.statistics import (
     StatisticData,
     StatisticMeanType,
     StatisticMetaData,
-    async_add_external_statistics,
+    get_last_statistics,
 )
 from homeassistant.helpers.update_coordinator import UpdateFailed
 from homeassistant.components.sensor import SensorDeviceClass
-from homeassistant.util import dt as dt_util, slugify
+from homeassistant.util import slugify
 from asyncio import timeout
 
 from .base import PhynDevice
+from .state import PhynWaterSensorState
 from ..entities.base import (
     PhynAlertEvent,
     PhynAlertSensor,
@@ -27,7 +30,16 @@ from ..entities.base import (
     PhynTemperatureSensor,
 )
 from ..entities.pw import PhynBatterySensor
-from ..const import DOMAIN, LOGGER
+from ..aggregator import HourlyAggregator
+from ..const import (
+    CONF_STATISTICS_BACKFILL_HOURS,
+    DEFAULT_STATISTICS_BACKFILL_HOURS,
+    DOMAIN,
+    LOGGER,
+)
+
+if TYPE_CHECKING:
+    from ..update_coordinator import PhynDataUpdateCoordinator
 
 _DEVICE_CLASS_UNIT_CLASS: dict[SensorDeviceClass, str | None] = {
     SensorDeviceClass.TEMPERATURE: "temperature",
@@ -36,8 +48,51 @@ _DEVICE_CLASS_UNIT_CLASS: dict[SensorDeviceClass, str | None] = {
     SensorDeviceClass.BATTERY: None,
 }
 
-if TYPE_CHECKING:
-    from ..update_coordinator import PhynDataUpdateCoordinator
+# History is fetched at most this many hours at a time.  The first fetch after
+# startup covers one chunk; older hours are backfilled one chunk per poll.
+BACKFILL_CHUNK_HOURS = 12
+# Long-term statistics imported for each sensor, by statistic_id suffix.
+STATISTIC_METRICS = ("air_temperature", "humidity", "battery")
+# Batches with at least this many readings are aggregated in the executor.
+EXECUTOR_AGGREGATION_MIN_READINGS = 2000
+
+
+def _hour_floor(ts: float) -> float:
+    """Return the start of the hour containing *ts*."""
+    return ts // 3600 * 3600
+
+
+def _aggregate_water_statistics(
+    data: list[dict], since: Mapping[str, float], until: float | None = None
+) -> dict[str, list[StatisticData]]:
+    """Aggregate raw ``get_water_statistics`` entries into hourly rows per metric.
+
+    Only hours from each metric's *since* up to *until* are kept.  Makes a
+    single pass over the entries.  Timestamp units:
+      - per-reading ts  (humidity/temperature lists): SECONDS (10-digit epoch)
+      - entry-level ts  (top-level battery timestamp): MILLISECONDS (13-digit epoch)
+    """
+    temperature = HourlyAggregator(since.get("air_temperature", 0), until)
+    humidity = HourlyAggregator(since.get("humidity", 0), until)
+    battery = HourlyAggregator(since.get("battery", 0), until)
+    for entry in data:
+        for aggregator, readings in (
+            (temperature, entry.get("temperature", ())),
+            (humidity, entry.get("humidity", ())),
+        ):
+            for reading in readings:
+                ts = reading.get("ts")
+                value = reading.get("value")
+                if ts is not None and value is not None:
+                    aggregator.add(ts, float(value))
+        if entry.get("ts") is not None and entry.get("battery_level") is not None:
+            battery.add(entry["ts"] / 1000, float(entry["battery_level"]))
+    return {
+        "air_temperature": temperature.statistics(),
+        "humidity": humidity.statistics(),
+        "battery": battery.statistics(),
+    }
+
 
 class PhynWaterSensorDevice(PhynDevice):
     """Phyn Water Sensor Device"""
@@ -49,6 +104,10 @@ class PhynWaterSensorDevice(PhynDevice):
         "temperature",
         "water_detected",
     ]
+    BACKGROUND_FIRST_FETCH: frozenset[str] = (
+        PhynDevice.BACKGROUND_FIRST_FETCH | {"statistics"}
+    )
+    LEARN_REPORT_CADENCE = True
 
     def __init__(
         self,
@@ -61,7 +120,19 @@ class PhynWaterSensorDevice(PhynDevice):
         """Initialize the Phyn Water Sensor device."""
         self._water_statistics: dict[str, Any] = {}
         self._last_statistics_ts: int = 0
+        # Start (epoch seconds) of the newest hourly bucket imported per metric.
+        # Older hours are final and never re-submitted.
+        self._statistics_watermarks: dict[str, float] | None = None
+        # Hour ranges [start, end) still to be backfilled, oldest first, and
+        # the oldest hour the backfill has been asked to reach.  Persisted in
+        # the device cache so an interrupted backfill resumes after a restart.
+        self._backfill_ranges: list[list[float]] | None = None
+        self._backfill_horizon: float | None = None
+        self._restored_backfill: dict[str, Any] = {}
+        # Oldest hour the first live fetch covers, until that fetch lands.
+        self._backfill_live_from: float | None = None
         super().__init__(coordinator, home_id, device_id, product_code, home_name)
+        self._device_state: PhynWaterSensorState = PhynWaterSensorState()
 
         self._battery_entity = PhynBatterySensor(self, "battery", "Battery")
         self._humidity_entity = PhynHumiditySensor(self, "humidity", "Humidity")
@@ -95,9 +166,9 @@ class PhynWaterSensorDevice(PhynDevice):
     @property
     def _base_device_name(self) -> str:
         """Return device name incorporating the app-assigned sensor name if available."""
-        if "name" not in self._device_state:
+        if self._device_state.name is None:
             return f"{self.manufacturer} {self.model}"
-        return f"{self.manufacturer} {self.model} - {self._device_state.get('name', '')}"
+        return f"{self.manufacturer} {self.model} - {self._device_state.name}"
 
     @property
     def high_humidity(self) -> bool | None:
@@ -155,26 +226,55 @@ class PhynWaterSensorDevice(PhynDevice):
             return alerts.get(key)
         return None
 
+    def cache_data(self) -> dict[str, Any]:
+        """Return the last-known data persisted for a warm start."""
+        if self._backfill_ranges is None or self._backfill_live_from is not None:
+            # The plan is only persisted once the first live fetch has landed.
+            backfill = self._restored_backfill
+        else:
+            backfill = {"ranges": self._backfill_ranges, "horizon": self._backfill_horizon}
+        return {
+            **super().cache_data(),
+            "water_statistics": self._water_statistics,
+            "statistics_backfill": backfill,
+        }
+
+    def restore_cache(self, data: Mapping[str, Any]) -> None:
+        """Seed the device from data returned by a previous ``cache_data``.
+
+        Statistics watermarks are read back from the recorder instead; the
+        backfill progress is kept until the first live statistics fetch has
+        landed.
+        """
+        super().restore_cache(data)
+        self._water_statistics.update(data.get("water_statistics", {}))
+        self._restored_backfill = dict(data.get("statistics_backfill", {}))
+
     async def async_update_data(self):
         """Update data via library."""
         try:
             async with timeout(20):
-                await self._update_device_state()
-                await self._update_device()
-                await self._update_alerts()
-                await self._update_alert_events()
-
-                #Update every hour
-                if self._update_count % 60 == 0:
-                    await self._update_firmware_information()
-
-                self._update_count += 1
+                # Water statistics are only fetched once the state shows a
+                # newer reading, so they run after the state fetch.  The first
+                # statistics fetch loads the import watermarks and runs in the
+                # background, as does each chunk of the history backfill,
+                # which backs off on failure like any other endpoint.
+                if self._backfill_ranges and self._endpoint_due("backfill"):
+                    self._start_background_fetch("backfill", self._async_backfill_chunk)
+                await self._async_run_fetch_plan([
+                    self._scheduled_fetchers({
+                        "state": self._update_device_state,
+                        "firmware": self._update_firmware_information,
+                    }),
+                    self._scheduled_fetchers({"statistics": self._update_device}),
+                    [self._update_alerts, self._update_alert_events],
+                ])
         except (RequestError) as error:
             raise UpdateFailed(error) from error
 
     async def _update_device(self, *_) -> None:
         """Update the device state from the API."""
-        device_reading_ts = self._device_state.get("temperature", {}).get("ts", 0)
+        device_reading_ts = self._device_state.reading_ts
 
         if device_reading_ts and device_reading_ts <= self._last_statistics_ts:
             LOGGER.debug(
@@ -183,15 +283,35 @@ class PhynWaterSensorDevice(PhynDevice):
             )
             return
 
+        if self._statistics_watermarks is None:
+            self._statistics_watermarks = await self._async_load_statistics_watermarks()
+
         to_ts = int(datetime.timestamp(datetime.now()) * 1000)
         if self._last_statistics_ts == 0:
-            from_ts = to_ts - (3600 * 72 * 1000)
+            # Fetch at most one chunk now.  After a restart, resume from the
+            # oldest metric's last imported hour; anything older than the
+            # chunk is left to the backfill.
+            live_from = _hour_floor(to_ts / 1000 - BACKFILL_CHUNK_HOURS * 3600)
+            resume_ts = min(self._statistics_watermarks.values(), default=None)
+            if resume_ts is not None:
+                live_from = max(live_from, resume_ts)
+            if self._backfill_ranges is None:
+                self._plan_backfill(live_from, resume_ts)
+            elif self._backfill_live_from is not None and live_from > self._backfill_live_from:
+                # A failed first fetch is retried after an hour boundary; the
+                # hours it no longer covers are left to the backfill.
+                self._backfill_ranges.append([self._backfill_live_from, live_from])
+            self._backfill_live_from = live_from
+            from_ts = int(live_from * 1000)
         else:
             # Fetch from 1h before the last known reading to cover any boundary overlap
             from_ts = (self._last_statistics_ts - 3600) * 1000
 
         data = await self._coordinator.api_client.device.get_water_statistics(self._phyn_device_id, from_ts, to_ts)
         LOGGER.debug("PW1 data (%s): %s", self._phyn_device_id, data)
+        if self._backfill_live_from is not None:
+            self._backfill_live_from = None
+            self._restored_backfill = {}
 
         item = None
         for entry in data:
@@ -221,76 +341,125 @@ class PhynWaterSensorDevice(PhynDevice):
 
         LOGGER.debug("Phyn Water device state (%s): %s", self._phyn_device_id, self._device_state)
 
-    async def _import_history(self, data: list[dict]) -> None:
-        """Import the full timestamped batch as external long-term statistics.
+    def _statistic_id(self, metric_key: str) -> str:
+        """Return the external statistic_id of one of the device's metrics."""
+        return f"{DOMAIN}:{slugify(self._phyn_device_id)}_{metric_key}"
+
+    async def _async_load_statistics_watermarks(self) -> dict[str, float]:
+        """Read the newest imported hour of each metric back from the recorder."""
+        hass = self._coordinator.hass
+        watermarks: dict[str, float] = {}
+        for metric_key in STATISTIC_METRICS:
+            statistic_id = self._statistic_id(metric_key)
+            try:
+                last = await get_instance(hass).async_add_executor_job(
+                    get_last_statistics, hass, 1, statistic_id, False, {"mean"}
+                )
+            except Exception as err:  # pylint: disable=broad-except
+                LOGGER.debug("Unable to read last statistic %s: %s", statistic_id, err)
+                continue
+            if rows := last.get(statistic_id):
+                watermarks[metric_key] = rows[0]["start"]
+        LOGGER.debug("PW1 (%s) statistics watermarks: %s", self._phyn_device_id, watermarks)
+        return watermarks
+
+    @property
+    def _backfill_hours(self) -> int:
+        """Return the configured depth of the statistics backfill."""
+        return int(self._coordinator.config_entry.options.get(
+            CONF_STATISTICS_BACKFILL_HOURS, DEFAULT_STATISTICS_BACKFILL_HOURS
+        ))
+
+    def _plan_backfill(self, live_from: float, resume_ts: float | None) -> None:
+        """Work out which hours older than *live_from* still need importing.
+
+        That is any backfill left over from before the restart, the gap since
+        the newest imported hour, and any extra depth configured since the
+        backfill last ran.
+        """
+        horizon = _hour_floor(time.time() - self._backfill_hours * 3600)
+        ranges = [list(r) for r in self._restored_backfill.get("ranges", [])]
+        gap_from = horizon if resume_ts is None else max(horizon, resume_ts)
+        if gap_from < live_from:
+            ranges.append([gap_from, live_from])
+        previous_horizon = self._restored_backfill.get("horizon")
+        if previous_horizon is not None and horizon < previous_horizon:
+            ranges.append([horizon, previous_horizon])
+        self._backfill_ranges = sorted(
+            [max(start, horizon), end] for start, end in ranges if end > horizon
+        )
+        self._backfill_horizon = (
+            horizon if previous_horizon is None else min(horizon, previous_horizon)
+        )
+        LOGGER.debug("PW1 (%s) backfill ranges: %s", self._phyn_device_id, self._backfill_ranges)
+
+    async def _async_backfill_chunk(self) -> None:
+        """Fetch and import the newest remaining chunk of the history backfill."""
+        if not self._backfill_ranges:
+            return
+        current = self._backfill_ranges[-1]
+        start, end = current
+        chunk_start = max(start, end - BACKFILL_CHUNK_HOURS * 3600)
+        data = await self._coordinator.api_client.device.get_water_statistics(
+            self._phyn_device_id, int(chunk_start * 1000), int(end * 1000)
+        )
+        await self._import_history(data, (chunk_start, end))
+        # The live fetch may have appended a newer range meanwhile.
+        if chunk_start <= start:
+            self._backfill_ranges.remove(current)
+        else:
+            current[1] = chunk_start
+
+    async def _import_history(
+        self, data: list[dict], window: tuple[float, float] | None = None
+    ) -> None:
+        """Import the timestamped batch as external long-term statistics.
+
+        Only hours at or after each metric's watermark are submitted: the
+        watermark hour itself may have gained readings, older hours are final.
+        Backfill chunks pass their *window* instead and leave the watermarks
+        alone.
+        Large batches are aggregated in the executor, and the rows are queued
+        on the coordinator's statistics sink, which submits them in batches.
 
         Statistics are stored under the ``phyn:`` namespace so the HA recorder
         can also compile its own statistics from the entities' live state without
         any conflict.
-
-        Timestamp units:
-          - per-reading ts  (humidity/temperature lists): SECONDS (10-digit epoch)
-          - entry-level ts  (top-level battery timestamp): MILLISECONDS (13-digit epoch)
         """
         hass = self._coordinator.hass
-        device_slug = slugify(self._phyn_device_id)
+        watermarks = self._statistics_watermarks
+        if watermarks is None:
+            watermarks = self._statistics_watermarks = {}
+
+        readings = sum(
+            len(entry.get("temperature", ())) + len(entry.get("humidity", ()))
+            for entry in data
+        )
+        if window is None:
+            since: Mapping[str, float] = dict(watermarks)
+            until = None
+        else:
+            since = dict.fromkeys(STATISTIC_METRICS, window[0])
+            until = window[1]
+        if readings >= EXECUTOR_AGGREGATION_MIN_READINGS:
+            buckets = await hass.async_add_executor_job(
+                _aggregate_water_statistics, data, since, until
+            )
+        else:
+            buckets = _aggregate_water_statistics(data, since, until)
 
         metrics = [
-            (
-                "air_temperature",
-                "Air Temperature",
-                self._temperature_entity,
-                [
-                    (dt_util.utc_from_timestamp(r["ts"]), float(r["value"]))
-                    for entry in data
-                    for r in entry.get("temperature", [])
-                    if r.get("ts") is not None and r.get("value") is not None
-                ],
-            ),
-            (
-                "humidity",
-                "Humidity",
-                self._humidity_entity,
-                [
-                    (dt_util.utc_from_timestamp(r["ts"]), float(r["value"]))
-                    for entry in data
-                    for r in entry.get("humidity", [])
-                    if r.get("ts") is not None and r.get("value") is not None
-                ],
-            ),
-            (
-                "battery",
-                "Battery",
-                self._battery_entity,
-                [
-                    (dt_util.utc_from_timestamp(entry["ts"] / 1000), float(entry["battery_level"]))
-                    for entry in data
-                    if entry.get("ts") is not None and entry.get("battery_level") is not None
-                ],
-            ),
+            ("air_temperature", "Air Temperature", self._temperature_entity),
+            ("humidity", "Humidity", self._humidity_entity),
+            ("battery", "Battery", self._battery_entity),
         ]
 
-        for metric_key, metric_label, entity, points in metrics:
-            if not points:
+        for metric_key, metric_label, entity in metrics:
+            stat_data = buckets[metric_key]
+            if not stat_data:
                 continue
 
-            # Bucket readings into hourly intervals and compute mean/min/max
-            hourly: dict[datetime, list[float]] = defaultdict(list)
-            for reading_dt, value in points:
-                hour_start = reading_dt.replace(minute=0, second=0, microsecond=0)
-                hourly[hour_start].append(value)
-
-            stat_data = [
-                StatisticData(
-                    start=hour_start,
-                    mean=sum(vals) / len(vals),
-                    min=min(vals),
-                    max=max(vals),
-                )
-                for hour_start, vals in sorted(hourly.items())
-            ]
-
-            statistic_id = f"{DOMAIN}:{device_slug}_{metric_key}"
+            statistic_id = self._statistic_id(metric_key)
             metadata = StatisticMetaData(
                 has_mean=True,
                 has_sum=False,
@@ -302,9 +471,11 @@ class PhynWaterSensorDevice(PhynDevice):
                 unit_class=_DEVICE_CLASS_UNIT_CLASS.get(entity.device_class),
             )
 
-            async_add_external_statistics(hass, metadata, stat_data)
+            self._coordinator.statistics_sink.add(metadata, stat_data)
+            if window is None:
+                watermarks[metric_key] = stat_data[-1]["start"].timestamp()
             LOGGER.debug(
-                "Imported %d hourly statistics buckets for %s (%s)",
+                "Queued %d hourly statistics buckets for %s (%s)",
                 len(stat_data), statistic_id, self._phyn_device_id,
             )
 
@@ -0,0 +1,293 @@
+"""Typed state records for Phyn devices.
+
+REST ``get_state`` payloads and MQTT pushes are parsed into these records once,
+when the data arrives, so entity property reads are plain attribute lookups
+instead of nested dict walks and rounding on every access.
+
+Every field remembers the timestamp of the value it holds.  A payload field
+older than the stored one is ignored, so a slow REST response can never
+overwrite a fresher MQTT push (or the other way round).
+"""
+from __future__ import annotations
+
+from collections.abc import Mapping
+import math
+from typing import Any
+
+
+def _reading(data: Any) -> float:
+    """Return a sensor reading's instantaneous value, else its window mean."""
+    if not isinstance(data, dict):
+        return 0.0
+    if data.get("v") is not None:
+        return data["v"]
+    if data.get("mean") is not None:
+        return data["mean"]
+    return 0.0
+
+
+def _timestamp(value: Any) -> float | None:
+    """Return a Phyn ``ts`` as epoch seconds, accepting seconds or milliseconds."""
+    if not isinstance(value, (int, float)) or value <= 0:
+        return None
+    if value > 1e11:
+        return value / 1000
+    return float(value)
+
+
+def _value(data: Any) -> Any:
+    """Return the ``v`` of a state field, or None when absent."""
+    if not isinstance(data, dict):
+        return None
+    return data.get("v")
+
+
+class PhynDeviceState:
+    """State shared by every Phyn device model."""
+
+    __slots__ = (
+        "_field_ts",
+        "fw_version",
+        "online",
+        "product_code",
+        "reported_at",
+        "serial_number",
+        "signal_strength",
+    )
+
+    def __init__(self) -> None:
+        """Initialize an empty state."""
+        self._field_ts: dict[str, float] = {}
+        self.fw_version: str = ""
+        self.online: bool = False
+        self.product_code: str = ""
+        #: Newest ``ts`` carried by a payload field, i.e. when the device
+        #: itself last reported, in epoch seconds.
+        self.reported_at: float | None = None
+        self.serial_number: str = ""
+        self.signal_strength: float | None = None
+
+    def __repr__(self) -> str:
+        """Return the populated fields for debug logging."""
+        fields = ", ".join(
+            f"{name}={getattr(self, name)!r}"
+            for name in self._all_slots()
+            if not name.startswith("_")
+        )
+        return f"{type(self).__name__}({fields})"
+
+    @classmethod
+    def _all_slots(cls) -> list[str]:
+        """Return the slot names declared across the class hierarchy."""
+        return [
+            name
+            for klass in reversed(cls.__mro__)
+            for name in getattr(klass, "__slots__", ())
+        ]
+
+    def _set(self, field: str, attr: str, value: Any, changed: set[str]) -> None:
+        """Assign *value* to *attr*, recording *field* when the value changed."""
+        if getattr(self, attr) != value:
+            setattr(self, attr, value)
+            changed.add(field)
+
+    def update(self, data: Mapping[str, Any], received_at: float | None = None) -> set[str]:
+        """Merge a state payload and return the names of the fields that changed.
+
+        Fields carrying their own ``ts`` are ordered by it; other fields are
+        stamped with *received_at*.  Fields older than the stored value are
+        skipped.
+        """
+        fresh: dict[str, Any] = {}
+        for field, value in data.items():
+            ts = _timestamp(value.get("ts")) if isinstance(value, dict) else None
+            if ts is not None and (self.reported_at is None or ts > self.reported_at):
+                self.reported_at = ts
+            if ts is None:
+                ts = received_at
+            if ts is not None:
+                if ts < self._field_ts.get(field, 0):
+                    continue
+                self._field_ts[field] = ts
+            fresh[field] = value
+        return self._apply(fresh)
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return the record as a ``get_state``-shaped payload for persistence."""
+        return {
+            "online_status": {"v": "online" if self.online else "offline"},
+            "fw_version": self.fw_version,
+            "product_code": self.product_code,
+            "serial_number": self.serial_number,
+            "signal_strength": self.signal_strength,
+        }
+
+    def _apply(self, data: Mapping[str, Any]) -> set[str]:
+        """Parse *data* into the record and return the names of changed fields."""
+        changed: set[str] = set()
+        if "online_status" in data:
+            self._set("online_status", "online", _value(data["online_status"]) == "online", changed)
+        if "fw_version" in data:
+            self._set("fw_version", "fw_version", data["fw_version"] or "", changed)
+        if "product_code" in data:
+            self._set("product_code", "product_code", data["product_code"] or "", changed)
+        if "serial_number" in data:
+            self._set("serial_number", "serial_number", data["serial_number"] or "", changed)
+        if "signal_strength" in data:
+            self._set("signal_strength", "signal_strength", data["signal_strength"], changed)
+        return changed
+
+
+class PhynPlusState(PhynDeviceState):
+    """State of a Phyn Plus (PP1/PP2) smart valve."""
+
+    __slots__ = (
+        "consumption",
+        "flow_rate",
+        "flow_state",
+        "psi",
+        "sov_status",
+        "temperature",
+    )
+
+    def __init__(self) -> None:
+        """Initialize an empty state."""
+        super().__init__()
+        self.consumption: float | None = None
+        self.flow_rate: float | None = None
+        self.flow_state: Any = 0.0
+        self.psi: float = 0.0
+        self.sov_status: str | None = None
+        self.temperature: float = 0.0
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return the record as a ``get_state``-shaped payload for persistence."""
+        return {
+            **super().as_dict(),
+            "consumption": self.consumption,
+            "flow": {"v": self.flow_rate},
+            "flow_state": {"v": self.flow_state},
+            "pressure": {"v": self.psi},
+            "sov_status": {"v": self.sov_status},
+            "temperature": {"v": self.temperature},
+        }
+
+    def _apply(self, data: Mapping[str, Any]) -> set[str]:
+        """Parse *data* into the record and return the names of changed fields."""
+        changed = super()._apply(data)
+        if "consumption" in data:
+            consumption = data["consumption"]
+            if isinstance(consumption, dict):
+                consumption = consumption.get("v")
+            if consumption is not None:
+                # Round consumption down to 2 decimal points.
+                consumption = math.floor(consumption * 100) / 100
+            self._set("consumption", "consumption", consumption, changed)
+        if "flow" in data:
+            flow = _value(data["flow"])
+            self._set("flow", "flow_rate", None if flow is None else round(flow, 3), changed)
+        if "flow_state" in data:
+            self._set("flow_state", "flow_state", _value(data["flow_state"]), changed)
+        if "pressure" in data:
+            self._set("pressure", "psi", round(_reading(data["pressure"]), 2), changed)
+        if "sov_status" in data:
+            self._set("sov_status", "sov_status", _value(data["sov_status"]), changed)
+        if "temperature" in data:
+            self._set("temperature", "temperature", round(_reading(data["temperature"]), 2), changed)
+        return changed
+
+
+class PhynClassicState(PhynDeviceState):
+    """State of a Phyn Classic (PC1) monitor with hot and cold lines."""
+
+    __slots__ = (
+        "cold_line_num",
+        "flow_rate",
+        "hot_line_num",
+        "psi1",
+        "psi2",
+        "sov_status",
+        "temperature1",
+        "temperature2",
+    )
+
+    def __init__(self) -> None:
+        """Initialize an empty state."""
+        super().__init__()
+        self.cold_line_num: int | None = None
+        self.flow_rate: float | None = None
+        self.hot_line_num: int | None = None
+        self.psi1: float = 0.0
+        self.psi2: float = 0.0
+        self.sov_status: str | None = None
+        self.temperature1: float = 0.0
+        self.temperature2: float = 0.0
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return the record as a ``get_state``-shaped payload for persistence."""
+        return {
+            **super().as_dict(),
+            "cold_line_num": self.cold_line_num,
+            "hot_line_num": self.hot_line_num,
+            "flow": {"v": self.flow_rate},
+            "pressure1": {"v": self.psi1},
+            "pressure2": {"v": self.psi2},
+            "sov_status": {"v": self.sov_status},
+            "temperature1": {"v": self.temperature1},
+            "temperature2": {"v": self.temperature2},
+        }
+
+    def _apply(self, data: Mapping[str, Any]) -> set[str]:
+        """Parse *data* into the record and return the names of changed fields."""
+        changed = super()._apply(data)
+        if "cold_line_num" in data:
+            self._set("cold_line_num", "cold_line_num", data["cold_line_num"], changed)
+        if "hot_line_num" in data:
+            self._set("hot_line_num", "hot_line_num", data["hot_line_num"], changed)
+        if "flow" in data:
+            flow = _value(data["flow"])
+            self._set("flow", "flow_rate", None if flow is None else round(flow, 3), changed)
+        for index in ("1", "2"):
+            if f"pressure{index}" in data:
+                psi = round(_reading(data[f"pressure{index}"]), 2)
+                self._set(f"pressure{index}", f"psi{index}", psi, changed)
+            if f"temperature{index}" in data:
+                temp = round(_reading(data[f"temperature{index}"]), 2)
+                self._set(f"temperature{index}", f"temperature{index}", temp, changed)
+        if "sov_status" in data:
+            self._set("sov_status", "sov_status", _value(data["sov_status"]), changed)
+        return changed
+
+
+class PhynWaterSensorState(PhynDeviceState):
+    """State of a Phyn Water Sensor (PW1)."""
+
+    __slots__ = (
+        "name",
+        "reading_ts",
+    )
+
+    def __init__(self) -> None:
+        """Initialize an empty state."""
+        super().__init__()
+        self.name: str | None = None
+        self.reading_ts: int = 0
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return the record as a ``get_state``-shaped payload for persistence."""
+        data = {
+            **super().as_dict(),
+            "temperature": {"ts": self.reading_ts},
+        }
+        if self.name is not None:
+            data["name"] = self.name
+        return data
+
+    def _apply(self, data: Mapping[str, Any]) -> set[str]:
+        """Parse *data* into the record and return the names of changed fields."""
+        changed = super()._apply(data)
+        if "name" in data:
+            self._set("name", "name", data["name"], changed)
+        if isinstance(data.get("temperature"), dict):
+            self._set("temperature", "reading_ts", data["temperature"].get("ts", 0) or 0, changed)
+        return changed
@@ -22,6 +22,7 @@ from homeassistant.components.update import (
     UpdateEntity,
     UpdateEntityFeature,
 )
+from homeassistant.components.valve import ValveEntity
 from homeassistant.const import (
     PERCENTAGE,
     UnitOfPressure,
@@ -37,6 +38,16 @@ if TYPE_CHECKING:
 WATER_ICON = "mdi:water"
 NAME_DAILY_USAGE = "Daily water usage"
 
+# Properties that make up an entity's state, per platform.  The coordinator
+# snapshots these each cycle and only notifies entities whose values changed.
+_SNAPSHOT_ATTRS: tuple[tuple[type, tuple[str, ...]], ...] = (
+    (BinarySensorEntity, ("is_on",)),
+    (SensorEntity, ("native_value",)),
+    (SwitchEntity, ("is_on",)),
+    (UpdateEntity, ("installed_version", "latest_version", "release_url")),
+    (ValveEntity, ("is_closed", "is_opening", "is_closing")),
+)
+
 class PhynEntity(Entity):
     """A base class for Phyn entities."""
 
@@ -54,7 +65,12 @@ class PhynEntity(Entity):
         """Init Phyn entity."""
         self._attr_name: str = name
         self._attr_unique_id: str = f"{device.id}_{entity_type}"
+        self._entity_type: str = entity_type
         self._device: PhynDevice = device
+        self._snapshot_attrs: tuple[str, ...] = next(
+            (attrs for platform, attrs in _SNAPSHOT_ATTRS if isinstance(self, platform)),
+            (),
+        )
 
     @property
     def device_info(self) -> DeviceInfo:
@@ -75,17 +91,25 @@ class PhynEntity(Entity):
         return self._device.available
 
     async def async_update(self) -> None:
-        """Update Phyn entity."""
-        await self._device.async_request_refresh()  # type: ignore[attr-defined]
+        """Update Phyn entity by refreshing its device."""
+        await self._device.coordinator.async_request_device_refresh(self._device.id)
+
+    @property
+    def tracks_snapshot(self) -> bool:
+        """Return True if the entity's state is refreshed from coordinator snapshots."""
+        return bool(self._snapshot_attrs)
+
+    def snapshot_value(self) -> tuple[Any, ...]:
+        """Return the values that make up this entity's current state."""
+        return (self.available, *(getattr(self, attr) for attr in self._snapshot_attrs))
 
     async def async_added_to_hass(self) -> None:
         """When entity is added to hass."""
-        try:
-            # Prefer coordinator listener when available
-            self.async_on_remove(self._device.coordinator.async_add_listener(self.async_write_ha_state))
-        except AttributeError:
-            # Fallback for older device structure that exposes async_add_listener directly
-            self.async_on_remove(self._device.async_add_listener(self.async_write_ha_state))  # type: ignore[attr-defined]
+        self.async_on_remove(
+            self._device.coordinator.async_add_entity_listener(
+                self._device.id, self._entity_type, self.async_write_ha_state
+            )
+        )
 
 class PhynAlertSensor(PhynEntity, BinarySensorEntity):
     """Alert sensor"""
@@ -234,11 +258,13 @@ class PhynSwitchEntity(PhynEntity, SwitchEntity):
         """Turn on the preference."""
         await self._device.set_device_preference(self._preference_name, "true")  # type: ignore[attr-defined]
         self.async_write_ha_state()
+        await self._device.coordinator.async_request_device_refresh(self._device.id, "preferences")
 
     async def async_turn_off(self, **kwargs: Any) -> None:
         """Turn off the preference."""
         await self._device.set_device_preference(self._preference_name, "false")  # type: ignore[attr-defined]
         self.async_write_ha_state()
+        await self._device.coordinator.async_request_device_refresh(self._device.id, "preferences")
 
 class PhynHumiditySensor(PhynEntity, SensorEntity):
     """Monitors the humidty."""
@@ -52,11 +52,13 @@ class PhynAutoShutoffModeSwitch(PhynSwitchEntity):
         """Turn on the preference."""
         await self._device.set_autoshutoff_enabled(True)
         self.async_write_ha_state()
+        await self._device.coordinator.async_request_device_refresh(self._device.id, "autoshutoff")
 
     async def async_turn_off(self, **kwargs: Any) -> None:
         """Turn off the preference."""
         await self._device.set_autoshutoff_enabled(False)
         self.async_write_ha_state()
+        await self._device.coordinator.async_request_device_refresh(self._device.id, "autoshutoff")
 
 
 class PhynAwayModeSwitch(PhynSwitchEntity):
@@ -97,9 +99,7 @@ class PhynFlowState(PhynEntity, SensorEntity):
 
     @property
     def native_value(self) -> str | None:
-        if "flow_state" in self._device._rt_device_state:
-            return self._device._rt_device_state['flow_state']['v']
-        return None
+        return self._device.flow_state
 
 
 class PhynLeakTestSensor(PhynEntity, BinarySensorEntity):
@@ -236,6 +236,7 @@ class PhynValve(PhynEntity, ValveEntity):
     async def async_open_valve(self) -> None:
         """Open the valve."""
         await self._device.coordinator.api_client.device.open_valve(self._device.id)
+        await self._device.coordinator.async_request_device_refresh(self._device.id, "state")
 
     def open_valve(self) -> None:
         """Open the valve."""
@@ -244,6 +245,7 @@ class PhynValve(PhynEntity, ValveEntity):
     async def async_close_valve(self) -> None:
         """Close the valve."""
         await self._device.coordinator.api_client.device.close_valve(self._device.id)
+        await self._device.coordinator.async_request_device_refresh(self._device.id, "state")
 
     def close_valve(self) -> None:
         """Close valve."""
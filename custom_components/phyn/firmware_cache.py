@@ -0,0 +1,59 @@
+"""Latest-firmware lookups shared by every Phyn device of the same model."""
+from __future__ import annotations
+
+import asyncio
+import time
+from typing import Any
+
+from .client import PhynClient
+from .const import LOGGER
+
+# Seconds a model's latest firmware info is reused before it is looked up again.
+FIRMWARE_CACHE_TTL = 3600
+
+
+class PhynFirmwareCache:
+    """Latest firmware info per product code, fetched once for all devices.
+
+    The latest firmware depends only on the model, so one lookup per product
+    code and TTL serves every device of that model.  Concurrent requests for
+    the same product code share a single in-flight lookup.
+    """
+
+    def __init__(self, api_client: PhynClient) -> None:
+        """Initialize the cache."""
+        self._api_client = api_client
+        self._entries: dict[str, tuple[float, dict[str, Any]]] = {}
+        self._inflight: dict[str, asyncio.Task[dict[str, Any]]] = {}
+
+    async def async_get(self, product_code: str, device_id: str) -> dict[str, Any]:
+        """Return the latest firmware info for *product_code*.
+
+        *device_id* identifies the device to query when a lookup is needed.
+        """
+        entry = self._entries.get(product_code)
+        if entry is not None and time.monotonic() - entry[0] < FIRMWARE_CACHE_TTL:
+            return entry[1]
+
+        task = self._inflight.get(product_code)
+        if task is None:
+            task = asyncio.ensure_future(self._async_fetch(product_code, device_id))
+            self._inflight[product_code] = task
+            task.add_done_callback(lambda done: self._fetch_done(product_code, done))
+        # Shielded so that a caller timing out does not cancel the lookup the
+        # other callers are waiting on.
+        return await asyncio.shield(task)
+
+    async def _async_fetch(self, product_code: str, device_id: str) -> dict[str, Any]:
+        """Look up the latest firmware info through one device of the model."""
+        info = (await self._api_client.device.get_latest_firmware_info(device_id))[0]
+        self._entries[product_code] = (time.monotonic(), info)
+        LOGGER.debug("Latest %s firmware: %s", product_code, info)
+        return info
+
+    def _fetch_done(self, product_code: str, task: asyncio.Task[dict[str, Any]]) -> None:
+        """Forget a finished lookup so the next expiry starts a new one."""
+        self._inflight.pop(product_code, None)
+        if not task.cancelled():
+            # Mark the error as retrieved even if every caller gave up waiting.
+            task.exception()
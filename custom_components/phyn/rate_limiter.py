@@ -0,0 +1,94 @@
+"""Account-wide request rate limiting with priority lanes."""
+from __future__ import annotations
+
+import asyncio
+from enum import IntEnum
+import heapq
+import itertools
+import time
+
+# Sustained requests per second and burst size shared by one Phyn account.
+DEFAULT_RATE = 2.0
+DEFAULT_BURST = 10
+
+
+class RequestPriority(IntEnum):
+    """Priority lanes, served in this order when requests have to queue."""
+
+    SAFETY = 0  # user commands: valve, preferences, leak tests
+    STATE = 1  # device state and settings polls
+    ALERTS = 2  # alert summaries and latest alerts
+    BULK = 3  # statistics history and firmware lookups
+
+
+# Tokens each lane leaves in the bucket for higher lanes, so a burst of bulk
+# work never drains the headroom a valve command needs.
+LANE_RESERVE: dict[RequestPriority, int] = {
+    RequestPriority.SAFETY: 0,
+    RequestPriority.STATE: 0,
+    RequestPriority.ALERTS: 1,
+    RequestPriority.BULK: 3,
+}
+
+
+class PhynRateLimiter:
+    """Token bucket shared by every request of an account.
+
+    Requests that cannot be sent right away queue by priority and are granted
+    tokens highest lane first, so bulk work automatically yields to
+    interactive and state traffic.
+    """
+
+    def __init__(self, rate: float = DEFAULT_RATE, burst: int = DEFAULT_BURST) -> None:
+        """Initialize the limiter."""
+        self._rate = rate
+        self._burst = burst
+        self._tokens = float(burst)
+        self._updated = time.monotonic()
+        self._waiters: list[tuple[int, int, asyncio.Future[None]]] = []
+        self._sequence = itertools.count()
+        self._wakeup: asyncio.TimerHandle | None = None
+
+    async def acquire(self, priority: RequestPriority) -> None:
+        """Wait until a request in the *priority* lane may be sent."""
+        future: asyncio.Future[None] = asyncio.get_running_loop().create_future()
+        heapq.heappush(self._waiters, (priority, next(self._sequence), future))
+        self._grant()
+        if future.done():
+            return
+        try:
+            await future
+        except asyncio.CancelledError:
+            if future.done() and not future.cancelled():
+                # Granted just as the caller gave up: hand the token back.
+                self._tokens += 1
+                self._grant()
+            raise
+
+    def _refill(self) -> None:
+        """Add the tokens accrued since the last refill."""
+        now = time.monotonic()
+        self._tokens = min(self._burst, self._tokens + (now - self._updated) * self._rate)
+        self._updated = now
+
+    def _grant(self) -> None:
+        """Hand tokens to queued requests, highest priority first."""
+        if self._wakeup is not None:
+            self._wakeup.cancel()
+            self._wakeup = None
+        self._refill()
+        while self._waiters:
+            priority, _, future = self._waiters[0]
+            if future.done():
+                heapq.heappop(self._waiters)
+                continue
+            needed = min(1 + LANE_RESERVE[RequestPriority(priority)], self._burst)
+            if self._tokens < needed:
+                # Wake up once the head of the queue can be served.
+                self._wakeup = asyncio.get_running_loop().call_later(
+                    (needed - self._tokens) / self._rate, self._grant
+                )
+                return
+            heapq.heappop(self._waiters)
+            self._tokens -= 1
+            future.set_result(None)
@@ -35,6 +35,12 @@ async def phyn_leak_test(service: ServiceCall):
     result = await client.device.run_leak_test(device_id, extended_test)
     assert 'code' in result and result['code'] == 'success'
 
+    # Pick up the valve state and the new test result from this device alone,
+    # instead of waiting out the health test TTL.
+    await service.hass.data[DOMAIN]["coordinator"].async_request_device_refresh(
+        device_id, "state", "health_tests"
+    )
+
 async def phyn_leak_test_service_setup(hass: HomeAssistant):
     """Setup service for phyn leak test"""
     hass.services.async_register(
@@ -0,0 +1,76 @@
+"""Account-wide batching of external long-term statistics imports."""
+from __future__ import annotations
+
+import time
+
+from homeassistant.components.recorder import get_instance
+from homeassistant.components.recorder.statistics import (
+    StatisticData,
+    StatisticMetaData,
+    async_add_external_statistics,
+)
+from homeassistant.core import HomeAssistant, callback
+
+from .const import LOGGER
+
+# Minimum seconds between flushes.  Long-term statistics are hourly, so
+# holding rows back for a few polls costs nothing visible.
+STATISTICS_FLUSH_INTERVAL = 300
+# Flushes are postponed while the recorder has more queued jobs than this.
+RECORDER_BACKLOG_LIMIT = 1000
+
+
+class PhynStatisticsSink:
+    """Collect hourly statistics rows from every device and submit them in batches.
+
+    Rows are merged per statistic_id and hour, so an hour that is re-aggregated
+    across several polls is submitted once, with its latest values.  The
+    recorder accepts a single statistic_id per import, so a flush makes one
+    submission per statistic with pending rows.
+    """
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        """Initialize the sink."""
+        self._hass = hass
+        self._pending: dict[str, tuple[StatisticMetaData, dict[float, StatisticData]]] = {}
+        self._flushed_at: float | None = None
+
+    @callback
+    def add(self, metadata: StatisticMetaData, rows: list[StatisticData]) -> None:
+        """Queue *rows* for the statistic described by *metadata*."""
+        statistic_id = metadata["statistic_id"]
+        _, pending_rows = self._pending.get(statistic_id, (metadata, {}))
+        for row in rows:
+            pending_rows[row["start"].timestamp()] = row
+        self._pending[statistic_id] = (metadata, pending_rows)
+
+    @callback
+    def async_flush(self, force: bool = False) -> None:
+        """Submit the queued rows, unless it is too soon or the recorder is busy."""
+        if not self._pending:
+            return
+        if "recorder" not in self._hass.config.components:
+            # The recorder is only an after_dependency; without it there is
+            # nowhere to submit the rows.
+            return
+        if not force:
+            if (
+                self._flushed_at is not None
+                and time.monotonic() - self._flushed_at < STATISTICS_FLUSH_INTERVAL
+            ):
+                return
+            backlog = get_instance(self._hass).backlog
+            if backlog > RECORDER_BACKLOG_LIMIT:
+                LOGGER.debug(
+                    "Recorder backlog is %d; postponing %d statistics imports",
+                    backlog, len(self._pending),
+                )
+                return
+
+        pending, self._pending = self._pending, {}
+        self._flushed_at = time.monotonic()
+        for metadata, rows in pending.values():
+            async_add_external_statistics(
+                self._hass, metadata, [rows[start] for start in sorted(rows)]
+            )
+        LOGGER.debug("Submitted %d statistics imports", len(pending))
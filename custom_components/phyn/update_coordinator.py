@@ -1,25 +1,56 @@
 """Phyn device object."""
 from __future__ import annotations
 
+import asyncio
 from datetime import timedelta
+from functools import partial
+import time
 from typing import TYPE_CHECKING, Any
 
 MQTT_DOWN_RELOAD_THRESHOLD = 10
-STATE_FETCH_FAILURE_THRESHOLD = 3  # ~3 min at 60s polls before surfacing UpdateFailed
+STATE_FETCH_FAILURE_THRESHOLD = 3  # consecutive all-device failures before surfacing UpdateFailed
+
+# Alert fetch sizes.  A never-seeded device needs a deep fetch so its history
+# is recorded as seen; steady-state polls probe a few alerts above the home's
+# high-water mark and only widen to a full page when the mark is not reached.
+ALERT_SEED_LIMIT = 50
+ALERT_PAGE_LIMIT = 20
+ALERT_PROBE_LIMIT = 5
+# Full re-read of every home's alerts, catching flag changes (ongoing/active)
+# on older alerts that the active summary does not reflect.
+ALERT_RECONCILE_INTERVAL = 900
+# Seconds a targeted device refresh waits, merging the requests that arrive
+# meanwhile (e.g. a command followed by update_entity) into one poll.
+DEVICE_REFRESH_COOLDOWN = 2
+# Longest poll interval while every device is failing; the interval doubles
+# per failed cycle up to this, and returns to normal on the first success.
+OUTAGE_MAX_UPDATE_INTERVAL = 900
 
-from aiophyn.api import API
 from aiophyn.errors import AuthenticationError, RequestError
 from asyncio import timeout
 
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.core import HomeAssistant
+from homeassistant.core import CALLBACK_TYPE, HomeAssistant, callback
 from homeassistant.exceptions import ConfigEntryAuthFailed
+from homeassistant.helpers.debounce import Debouncer
 from homeassistant.helpers.update_coordinator import DataUpdateCoordinator, UpdateFailed
 
 
-from .const import DOMAIN as PHYN_DOMAIN, LOGGER
+from .alert_store import PhynSeenAlertStore
+from .circuit_breaker import jittered
+from .client import PhynClient
+from .device_cache import PhynDeviceCache
+from .firmware_cache import PhynFirmwareCache
+from .statistics_sink import PhynStatisticsSink
+from .const import (
+    CONF_MAX_CONCURRENT_UPDATES,
+    DEFAULT_MAX_CONCURRENT_UPDATES,
+    DOMAIN as PHYN_DOMAIN,
+    LOGGER,
+)
 
 
+from .devices.base import PhynDeviceSnapshot
 from .devices.pc import PhynClassicDevice
 from .devices.pp import PhynPlusDevice
 from .devices.pw import PhynWaterSensorDevice
@@ -27,47 +58,83 @@ from .devices.pw import PhynWaterSensorDevice
 if TYPE_CHECKING:
     from .devices.base import PhynDevice
 
-class PhynDataUpdateCoordinator(DataUpdateCoordinator[None]):
-    """Update coordinator for Phyn devices"""
+class PhynDataUpdateCoordinator(DataUpdateCoordinator[dict[str, PhynDeviceSnapshot]]):
+    """Update coordinator for Phyn devices.
+
+    Each cycle produces an immutable snapshot per device.  The snapshot is
+    diffed against the previous cycle and only entities whose values changed
+    are notified.
+    """
+
+    data: dict[str, PhynDeviceSnapshot]
+
     def __init__(
         self,
         hass: HomeAssistant,
-        api_client: API,
+        api_client: PhynClient,
         config_entry: ConfigEntry,
         update_interval: timedelta = timedelta(seconds=60),
     ) -> None:
         """Initialize the device."""
         self.hass: HomeAssistant = hass
-        self.api_client: API = api_client
+        self.api_client: PhynClient = api_client
         self.config_entry: ConfigEntry = config_entry
         self._devices: list[PhynDevice] = []
+        self._push_devices: dict[str, PhynDevice] = {}
         self._alert_active_summary: dict = {}
         self._alert_latest_by_home: dict[str, list[dict]] = {}
-        self._alert_initial_fetch_done: bool = False
+        self._alert_types_by_home: dict[str, list[str]] = {}
+        self._alert_latest_by_device: dict[str, list[dict]] = {}
+        self._device_ids_by_home: dict[str, list[str]] = {}
+        self._alert_high_water_by_home: dict[str, str] = {}
+        self._alert_summary_by_home: dict[str, dict[str, Any]] = {}
+        self._alert_reconciled_at: dict[str, float] = {}
+        self.seen_alerts: PhynSeenAlertStore = PhynSeenAlertStore(hass, config_entry.entry_id)
+        self.device_cache: PhynDeviceCache = PhynDeviceCache(hass, config_entry.entry_id)
+        self.statistics_sink: PhynStatisticsSink = PhynStatisticsSink(hass)
+        self.firmware_cache: PhynFirmwareCache = PhynFirmwareCache(api_client)
         self._mqtt_down_cycles: int = 0
         self._reload_in_progress: bool = False
+        self._mqtt_connect_failed: bool = False
         self._state_fetch_failures: int = 0
+        self._base_update_interval: timedelta = update_interval
+        self._device_failures: dict[str, int] = {}
+        self._changed_entities: dict[str, set[str]] = {}
+        self._snapshots: dict[str, PhynDeviceSnapshot] = {}
+        self._device_refreshers: dict[str, Debouncer[Any]] = {}
+        self._device_refresh_endpoints: dict[str, set[str]] = {}
 
         super().__init__(
             hass,
             LOGGER,
             name=f"{PHYN_DOMAIN}-coordinator",
             update_interval=update_interval,
+            always_update=False,
         )
     
     def add_device(self, home_id: str, device_id: str, product_code: str, home_name: str = "") -> None:
         """Add a device to the coordinator."""
+        device: PhynDevice
         if product_code in ["PP1","PP2"]:
-            self._devices.append(
-                PhynPlusDevice(self, home_id, device_id, product_code, home_name)
-            )
+            device = PhynPlusDevice(self, home_id, device_id, product_code, home_name)
         elif product_code in ["PC1"]:
-            self._devices.append(
-                PhynClassicDevice(self, home_id, device_id, product_code, home_name)
-            )
+            device = PhynClassicDevice(self, home_id, device_id, product_code, home_name)
         elif product_code in ["PW1"]:
-            self._devices.append(
-                PhynWaterSensorDevice(self, home_id, device_id, product_code, home_name)
+            device = PhynWaterSensorDevice(self, home_id, device_id, product_code, home_name)
+        else:
+            return
+        if (cached := self.device_cache.get(device_id)) is not None:
+            device.restore_cache(cached)
+        self._devices.append(device)
+        self._device_ids_by_home.setdefault(home_id, []).append(device_id)
+        if device.mqtt_topic is not None:
+            self._push_devices[device_id] = device
+
+        # Keep the per-home union of alert types current so each poll can
+        # request exactly the types the home's devices care about.
+        if device.ALERT_EVENT_TYPES:
+            self._alert_types_by_home[home_id] = sorted(
+                set(self._alert_types_by_home.get(home_id, [])).union(device.ALERT_EVENT_TYPES)
             )
 
     @property
@@ -75,8 +142,72 @@ class PhynDataUpdateCoordinator(DataUpdateCoordinator[None]):
         """Return list of devices."""
         return self._devices
 
-    async def _async_update_data(self) -> None:
-        """Update data via library."""
+    async def _async_update_data(self) -> dict[str, PhynDeviceSnapshot]:
+        """Update data via library and snapshot every device."""
+        self._changed_entities = {}
+        try:
+            await self._async_update_devices()
+        except UpdateFailed:
+            # Still diff so that entities of failing devices go unavailable.
+            self._async_build_snapshots()
+            raise
+        return self._async_build_snapshots()
+
+    @callback
+    def _async_build_snapshots(self) -> dict[str, PhynDeviceSnapshot]:
+        """Snapshot every device and record which entities changed.
+
+        The diff is against the previous snapshots, including those of a
+        failed cycle, which never reach ``self.data``.
+        """
+        previous = self._snapshots
+        snapshots: dict[str, PhynDeviceSnapshot] = {}
+        for device in self._devices:
+            snapshot = device.snapshot()
+            old = previous.get(device.id, {})
+            self._changed_entities[device.id] = {
+                key for key, value in snapshot.items()
+                if key not in old or old[key] != value
+            }
+            snapshots[device.id] = snapshot
+        self._snapshots = snapshots
+        return snapshots
+
+    @callback
+    def async_publish_device(self, device: PhynDevice) -> None:
+        """Notify the entities of data a device fetched outside a poll cycle."""
+        if self.data is None:
+            # The first refresh has not finished; it will snapshot the device.
+            return
+        snapshot = device.snapshot()
+        old = self._snapshots.get(device.id, {})
+        changed = {
+            key for key, value in snapshot.items()
+            if key not in old or old[key] != value
+        }
+        if not changed:
+            return
+        self._snapshots = {**self._snapshots, device.id: snapshot}
+        self.data = {**self.data, device.id: snapshot}
+        self._changed_entities = {device.id: changed}
+        self.async_update_listeners()
+
+    @callback
+    def async_add_entity_listener(
+        self, device_id: str, entity_type: str, update_callback: CALLBACK_TYPE
+    ) -> CALLBACK_TYPE:
+        """Listen for updates that change the given entity's snapshot."""
+
+        @callback
+        def _async_entity_changed() -> None:
+            if entity_type in self._changed_entities.get(device_id, ()):
+                update_callback()
+
+        return self.async_add_listener(_async_entity_changed)
+
+    async def _async_update_devices(self) -> None:
+        """Fetch alerts and poll every device."""
+        summary_fresh = True
         try:
             self._alert_active_summary = await self.api_client.alert.get_active_summary(
                 self.api_client.username, "unresolved"
@@ -84,56 +215,76 @@ class PhynDataUpdateCoordinator(DataUpdateCoordinator[None]):
         except AuthenticationError:
             raise
         except Exception as err:  # noqa: BLE001
+            summary_fresh = False
             LOGGER.warning("Could not fetch alert active summary: %s", err)
 
-        # On the first poll use a large limit to seed _seen_alert_ids so that
-        # historical alerts are never replayed as "new" events on startup.
-        # On subsequent polls a small limit is sufficient — any alert created
-        # in the last 60 s will be at the top of the most-recent list.
-        alert_limit = 50 if not self._alert_initial_fetch_done else 20
-
-        home_ids = {device.home_id for device in self._devices}
-        for home_id in home_ids:
-            # Request only the union of alert types declared by devices in this
-            # home.  Homes with no alert-consuming devices skip the call entirely.
-            types = sorted({
-                t
-                for device in self._devices
-                if device.home_id == home_id
-                for t in device.ALERT_EVENT_TYPES
-            })
-            if not types:
-                continue
-            try:
-                self._alert_latest_by_home[home_id] = await self.api_client.alert.get_latest(
-                    self.api_client.username,
-                    home_id,
-                    alert_type=types,
-                    limit=alert_limit,
-                )
-            except AuthenticationError:
-                raise
-            except Exception as err:  # noqa: BLE001
-                LOGGER.warning("Could not fetch latest alerts for home %s: %s", home_id, err)
+        # Homes with no alert-consuming devices have no entry and skip the
+        # call entirely; the remaining homes are fetched concurrently.
+        home_ids = list(self._alert_types_by_home)
+        home_results = await asyncio.gather(
+            *(self._async_update_home_alerts(home_id, summary_fresh) for home_id in home_ids),
+            return_exceptions=True,
+        )
+        for home_id, result in zip(home_ids, home_results):
+            if isinstance(result, AuthenticationError):
+                raise result
+            if isinstance(result, BaseException):
+                LOGGER.warning("Could not fetch latest alerts for home %s: %s", home_id, result)
 
-        self._alert_initial_fetch_done = True
+        # Split the fetched alerts per device once per cycle so each device
+        # reads its own slice instead of scanning the whole home list.
+        by_device: dict[str, list[dict]] = {}
+        for alerts in self._alert_latest_by_home.values():
+            for alert in alerts:
+                alert_device_id = alert.get("device_id")
+                if alert_device_id is not None:
+                    by_device.setdefault(alert_device_id, []).append(alert)
+        self._alert_latest_by_device = by_device
 
-        last_state_error: RequestError | None = None
-        for device in self._devices:
-            try:
-                async with timeout(20):
-                    await device.async_update_data()
-            except AuthenticationError as error:
+
+        # Poll devices concurrently, bounded by the configured cap, so one slow
+        # device no longer delays every device queued behind it.  Errors are
+        # collected per device instead of aborting the remaining polls.
+        semaphore = asyncio.Semaphore(self._max_concurrent_updates)
+        device_errors = await asyncio.gather(
+            *(self._async_update_device(device, semaphore) for device in self._devices)
+        )
+        # Devices queue long-term statistics during their poll; submit them
+        # together once every device has finished.
+        self.statistics_sink.async_flush()
+
+        last_state_error: Exception | None = None
+        failed_devices = 0
+        for device, error in zip(self._devices, device_errors):
+            if isinstance(error, AuthenticationError):
                 raise ConfigEntryAuthFailed(
                     translation_domain="phyn",
                     translation_key="auth_failed",
                 ) from error
-            except RequestError as error:
-                last_state_error = error
-                break
+            if error is None:
+                if self._device_failures.pop(device.id, 0):
+                    LOGGER.info("Phyn device %s recovered", device.id)
+                continue
+            failed_devices += 1
+            last_state_error = error
+            failures = self._device_failures.get(device.id, 0) + 1
+            self._device_failures[device.id] = failures
+            LOGGER.warning(
+                "Error fetching state for Phyn device %s (%s/%s): %s",
+                device.id,
+                failures,
+                STATE_FETCH_FAILURE_THRESHOLD,
+                error,
+            )
 
-        if last_state_error is not None:
+        if last_state_error is not None and failed_devices == len(self._devices):
+            # Every device failed: treat it as an account-wide outage and
+            # back off instead of piling retries onto a struggling cloud.
             self._state_fetch_failures += 1
+            self.update_interval = timedelta(seconds=jittered(min(
+                self._base_update_interval.total_seconds() * 2 ** self._state_fetch_failures,
+                OUTAGE_MAX_UPDATE_INTERVAL,
+            )))
             if self._state_fetch_failures >= STATE_FETCH_FAILURE_THRESHOLD:
                 raise UpdateFailed(last_state_error) from last_state_error
             LOGGER.warning(
@@ -145,13 +296,24 @@ class PhynDataUpdateCoordinator(DataUpdateCoordinator[None]):
             return
 
         self._state_fetch_failures = 0
+        self.update_interval = self._base_update_interval
+        self.seen_alerts.async_prune()
+        self.device_cache.async_schedule_save(self._device_cache_data)
+
+        mqtt = self.api_client.mqtt
+        if self._mqtt_connect_failed and mqtt.is_connected():
+            # aiophyn connected on its own after the startup connect failed;
+            # subscribe the topics that startup skipped.
+            try:
+                await self._async_subscribe_devices()
+            except Exception as err:  # noqa: BLE001
+                LOGGER.warning("Unable to subscribe to Phyn MQTT topics: %s", err)
 
         # As a last-resort, reload the config entry to rebuild the MQTT client from
         # scratch.
         # The threshold is intentionally high (~10 min at 60s intervals) because the
         # reconnect loop should recover on its own well before this fires.
-        mqtt = self.api_client.mqtt
-        if mqtt.topics and not mqtt.is_connected():
+        if (mqtt.topics or self._mqtt_connect_failed) and not mqtt.is_connected():
             self._mqtt_down_cycles += 1
 
             # Snapshot aiophyn reconnect state-machine internals for diagnostics.
@@ -213,7 +375,199 @@ class PhynDataUpdateCoordinator(DataUpdateCoordinator[None]):
         else:
             self._mqtt_down_cycles = 0
     
+    @property
+    def _max_concurrent_updates(self) -> int:
+        """Return the per-account cap on concurrently polled devices."""
+        return max(
+            1,
+            int(self.config_entry.options.get(
+                CONF_MAX_CONCURRENT_UPDATES, DEFAULT_MAX_CONCURRENT_UPDATES
+            )),
+        )
+
+    async def _async_update_home_alerts(self, home_id: str, summary_fresh: bool) -> None:
+        """Refresh the cached latest alerts of a home.
+
+        Seen alert IDs persist across restarts, so the deep seeding fetch is
+        only needed while a device in the home has never been seeded.  Between
+        periodic reconciliations a quiet home, whose devices' active summary
+        has not changed, is not queried at all; otherwise only the few alerts
+        above the home's high-water mark are requested.
+        """
+        device_ids = self._device_ids_by_home.get(home_id, [])
+        summary = {
+            device_id: self._alert_active_summary.get(device_id)
+            for device_id in device_ids
+        }
+        cached = self._alert_latest_by_home.get(home_id)
+        high_water = self._alert_high_water_by_home.get(home_id)
+        now = time.monotonic()
+
+        if not all(self.seen_alerts.device_seeded(device_id) for device_id in device_ids):
+            alerts = await self._async_fetch_latest_alerts(home_id, ALERT_SEED_LIMIT)
+            self._alert_reconciled_at[home_id] = now
+        elif (
+            cached is None
+            or now - self._alert_reconciled_at.get(home_id, 0) >= ALERT_RECONCILE_INTERVAL
+        ):
+            alerts = await self._async_fetch_latest_alerts(home_id, ALERT_PAGE_LIMIT)
+            self._alert_reconciled_at[home_id] = now
+        elif summary_fresh and summary == self._alert_summary_by_home.get(home_id):
+            return
+        else:
+            alerts = await self._async_fetch_latest_alerts(home_id, ALERT_PROBE_LIMIT)
+            if len(alerts) >= ALERT_PROBE_LIMIT and all(a.get("id") != high_water for a in alerts):
+                # More new alerts than the probe returned; read a full page.
+                alerts = await self._async_fetch_latest_alerts(home_id, ALERT_PAGE_LIMIT)
+            else:
+                probed = {a.get("id") for a in alerts}
+                alerts = (
+                    alerts + [a for a in cached if a.get("id") not in probed]
+                )[:ALERT_PAGE_LIMIT]
+
+        self._alert_latest_by_home[home_id] = alerts
+        if summary_fresh:
+            self._alert_summary_by_home[home_id] = summary
+        if alerts and alerts[0].get("id") is not None:
+            self._alert_high_water_by_home[home_id] = alerts[0]["id"]
+
+    async def _async_fetch_latest_alerts(self, home_id: str, limit: int) -> list[dict]:
+        """Fetch the latest alerts of the home's declared alert types."""
+        return await self.api_client.alert.get_latest(
+            self.api_client.username,
+            home_id,
+            alert_type=self._alert_types_by_home[home_id],
+            limit=limit,
+        )
+
+    async def async_request_device_refresh(self, device_id: str, *endpoints: str) -> None:
+        """Poll a single device soon, without refreshing the whole account.
+
+        *endpoints* are refetched even if their cached data has not expired;
+        with none given, only the device state is, so a routine
+        ``update_entity`` leaves the slower endpoints on their schedule.
+        Requests arriving within DEVICE_REFRESH_COOLDOWN are merged into one
+        poll.
+        """
+        device = next((device for device in self._devices if device.id == device_id), None)
+        if device is None:
+            return
+        self._device_refresh_endpoints.setdefault(device_id, set()).update(
+            endpoints or ("state",)
+        )
+        refresher = self._device_refreshers.get(device_id)
+        if refresher is None:
+            refresher = self._device_refreshers[device_id] = Debouncer(
+                self.hass,
+                LOGGER,
+                cooldown=DEVICE_REFRESH_COOLDOWN,
+                immediate=False,
+                function=partial(self._async_refresh_device, device),
+            )
+        await refresher.async_call()
+
+    async def _async_refresh_device(self, device: PhynDevice) -> None:
+        """Poll one device and publish the entities it changed."""
+        device.invalidate_endpoint(*self._device_refresh_endpoints.pop(device.id, ()))
+        error = await self._async_update_device(device, asyncio.Semaphore())
+        if error is not None:
+            # Failure accounting is left to the regular poll.
+            LOGGER.warning("Error refreshing Phyn device %s: %s", device.id, error)
+            return
+        self.async_publish_device(device)
+
+    async def async_shutdown(self) -> None:
+        """Cancel pending device work and shut the coordinator down."""
+        for refresher in self._device_refreshers.values():
+            refresher.async_shutdown()
+        for device in self._devices:
+            device.async_shutdown()
+        await super().async_shutdown()
+
+    def device_update_failed(self, device_id: str) -> bool:
+        """Return True if polling this device has failed repeatedly."""
+        return self._device_failures.get(device_id, 0) >= STATE_FETCH_FAILURE_THRESHOLD
+
+    async def _async_update_device(
+        self, device: PhynDevice, semaphore: asyncio.Semaphore
+    ) -> Exception | None:
+        """Poll a single device, returning the error instead of raising it."""
+        async with semaphore:
+            try:
+                async with timeout(20):
+                    await device.async_update_data()
+            except (AuthenticationError, RequestError, UpdateFailed, TimeoutError) as error:
+                return error
+            except Exception as error:  # noqa: BLE001
+                # A malformed payload or an unwrapped transport error must not
+                # abort the sibling polls; count it as this device's failure.
+                LOGGER.exception("Unexpected error polling Phyn device %s", device.id)
+                return error
+        return None
+
+    async def async_load_storage(self) -> None:
+        """Load persisted coordinator state before devices are added."""
+        await self.seen_alerts.async_load()
+        await self.device_cache.async_load()
+
+    async def async_save_storage(self) -> None:
+        """Write persisted coordinator state and queued statistics out."""
+        self.statistics_sink.async_flush(force=True)
+        await self.seen_alerts.async_save()
+        await self.device_cache.async_save()
+
+    @callback
+    def _device_cache_data(self) -> dict[str, dict[str, Any]]:
+        """Return every device's warm-start data, keyed by device ID."""
+        return {device.id: device.cache_data() for device in self._devices}
+
+    async def async_start(self) -> None:
+        """Connect MQTT and run the first refresh, then subscribe devices.
+
+        Runs as a background task once the platforms are set up, so Home
+        Assistant's startup does not wait on the Phyn cloud.  The MQTT connect
+        and the first state fetch overlap.
+        """
+        connected, _ = await asyncio.gather(self._async_connect_mqtt(), self.async_refresh())
+        if not connected:
+            # Devices keep polling.  The topics are subscribed by the first
+            # poll that finds the connection up, and the MQTT watchdog reloads
+            # the entry if it is still down after its threshold.
+            self._mqtt_connect_failed = True
+        await self.async_setup()
+
+    async def _async_connect_mqtt(self) -> bool:
+        """Connect MQTT, returning whether it succeeded."""
+        try:
+            await self.api_client.mqtt.connect()
+        except Exception as err:  # noqa: BLE001
+            LOGGER.warning("Unable to connect to Phyn MQTT: %s", err)
+            return False
+        return True
+
     async def async_setup(self) -> None:
-        """Setup devices."""
+        """Setup devices and route MQTT updates to them.
+
+        A single handler dispatches each message by device_id, rather than
+        every device receiving (and discarding) every message.
+        """
         for device in self._devices:
             await device.async_setup()
+
+        await self.api_client.mqtt.add_event_handler("update", self._async_on_mqtt_update)
+        if not self._mqtt_connect_failed:
+            await self._async_subscribe_devices()
+
+    async def _async_subscribe_devices(self) -> None:
+        """Subscribe to the topic of every device with real-time updates."""
+        mqtt = self.api_client.mqtt
+        await asyncio.gather(
+            *(mqtt.subscribe(device.mqtt_topic) for device in self._push_devices.values())
+        )
+        self._mqtt_connect_failed = False
+
+    async def _async_on_mqtt_update(self, device_id: str | None, data: dict[str, Any]) -> None:
+        """Route a real-time MQTT update to the device it belongs to."""
+        if device_id is None or (device := self._push_devices.get(device_id)) is None:
+            return
+        await device.on_device_update(device_id, data)